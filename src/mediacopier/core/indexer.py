@@ -10,6 +10,13 @@ from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
+from mediacopier.core.text_keys import (
+    classify_tokens,
+    extract_base_name,
+    normalize_text,
+    tokenize,
+)
+
 if TYPE_CHECKING:
     from mediacopier.core.metadata_audio import AudioMeta
     from mediacopier.core.metadata_video import VideoMeta
@@ -118,9 +125,14 @@ def should_ignore_file(file_path: Path) -> bool:
     return False
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaFile:
-    """Represents a media file in the catalog."""
+    """Represents a media file in the catalog.
+
+    nombre_base must not be reassigned after construction: the matching keys
+    derived from it are cached on first access and would go stale. Build a
+    new MediaFile (e.g. with dataclasses.replace) to rename one.
+    """
 
     path: str
     nombre_base: str
@@ -129,6 +141,51 @@ class MediaFile:
     tipo: MediaType
     audio_meta: "AudioMeta | None" = None
     video_meta: "VideoMeta | None" = None
+    # Matching keys derived from nombre_base, computed once on first access
+    _normalized_name: str | None = field(default=None, init=False, repr=False, compare=False)
+    _base_name: str | None = field(default=None, init=False, repr=False, compare=False)
+    _tokens: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+    _penalties: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+    _bonuses: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def normalized_name(self) -> str:
+        """Get the normalized name used for matching."""
+        if self._normalized_name is None:
+            self._normalized_name = normalize_text(self.nombre_base)
+        return self._normalized_name
+
+    @property
+    def base_name(self) -> str:
+        """Get the base name (without version suffixes) used for matching."""
+        if self._base_name is None:
+            self._base_name = extract_base_name(self.nombre_base)
+        return self._base_name
+
+    @property
+    def tokens(self) -> frozenset[str]:
+        """Get the word tokens of the normalized name."""
+        if self._tokens is None:
+            self._tokens = tokenize(self.normalized_name)
+        return self._tokens
+
+    @property
+    def penalties(self) -> frozenset[str]:
+        """Get the penalty words (live, cover, ...) present in the name."""
+        if self._penalties is None:
+            self._classify_name()
+        return self._penalties
+
+    @property
+    def bonuses(self) -> frozenset[str]:
+        """Get the bonus words (official, remastered, ...) present in the name."""
+        if self._bonuses is None:
+            self._classify_name()
+        return self._bonuses
+
+    def _classify_name(self) -> None:
+        """Fill the penalty and bonus words from a single scan of the name."""
+        self._penalties, self._bonuses = classify_tokens(self.nombre_base)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary."""
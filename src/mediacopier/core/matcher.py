@@ -2,57 +2,30 @@
 
 from __future__ import annotations
 
+import heapq
 import re
-import unicodedata
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
-from mediacopier.core.indexer import MediaCatalog, MediaFile
+from mediacopier.core.indexer import MediaCatalog, MediaFile, MediaType
 from mediacopier.core.models import CopyRules, RequestedItem, RequestedItemType
+from mediacopier.core.text_keys import (
+    classify_tokens,
+    extract_base_name,
+    normalize_text,
+    tokenize,
+)
 
-# Try to use rapidfuzz for better fuzzy matching, fallback to difflib
+# rapidfuzz is a core dependency; the pure-Python scorer only covers broken
+# or minimal installs where it cannot be imported
 try:
     from rapidfuzz import fuzz as rapidfuzz_fuzz
+    from rapidfuzz import process as rapidfuzz_process
 
     RAPIDFUZZ_AVAILABLE = True
 except ImportError:
     RAPIDFUZZ_AVAILABLE = False
-    import difflib
-
-
-# Patterns to remove from song names for normalization
-# Uses word boundary and captures everything until end of string or parenthesis/bracket
-FEAT_PATTERNS = re.compile(
-    r"\b(?:feat\.?|ft\.?|featuring)\b[\s.]*[^()[\]]*?(?=\s*[\(\[]|$)",
-    re.IGNORECASE,
-)
-
-# Parenthetical content patterns (for cleanup but also for analysis)
-PARENTHETICAL_PATTERN = re.compile(r"\([^)]*\)|\[[^\]]*\]")
-
-# Words that indicate lower-quality versions for songs
-PENALTY_WORDS = frozenset({
-    "live",
-    "cover",
-    "karaoke",
-    "instrumental",
-    "acoustic",
-    "demo",
-    "remix",
-    "bootleg",
-    "tribute",
-})
-
-# Words that indicate quality/official versions (bonus scoring)
-BONUS_WORDS = frozenset({
-    "official",
-    "remastered",
-    "remaster",
-    "deluxe",
-    "hd",
-    "hq",
-    "original",
-})
 
 # Default exclusion words for filtering junk content
 DEFAULT_EXCLUSION_WORDS = frozenset({
@@ -147,10 +120,54 @@ def get_resolution_score(resolution: str | None, width: int | None, height: int
     return 0
 
 
+def _exclusion_word_regex(word: str) -> str:
+    """Build the regex source for one lowercased exclusion word or phrase."""
+    if " " in word:
+        # Phrases use simple substring matching
+        return re.escape(word)
+    # Single words use word boundary matching
+    return rf"\b{re.escape(word)}\b"
+
+
+@lru_cache(maxsize=128)
+def _build_exclusion_re(
+    exclusion_words: tuple[str, ...],
+) -> tuple[re.Pattern[str] | None, tuple[tuple[str, re.Pattern[str]], ...]]:
+    """Compile an exclusion word list once.
+
+    Args:
+        exclusion_words: Words/phrases as given by the caller.
+
+    Returns:
+        Tuple of (combined, per_word): a single alternation used to reject
+        non-matching texts in one scan (None if the list has no usable
+        words), and the per-word patterns in list order paired with the
+        original word.
+    """
+    per_word = []
+    single_words: list[str] = []
+    phrases: list[str] = []
+    for word in exclusion_words:
+        word_lower = word.strip().lower()
+        if word_lower:
+            per_word.append((word, re.compile(_exclusion_word_regex(word_lower))))
+            (phrases if " " in word_lower else single_words).append(re.escape(word_lower))
+    if not per_word:
+        return None, ()
+    # Share the word boundaries across all single words, so each position
+    # costs one boundary check instead of one per word
+    alternatives = phrases
+    if single_words:
+        alternatives = [rf"\b(?:{'|'.join(single_words)})\b", *phrases]
+    combined = re.compile("|".join(alternatives))
+    return combined, tuple(per_word)
+
+
 def contains_exclusion_word(text: str, exclusion_words: list[str]) -> tuple[bool, str | None]:
     """Check if text contains any exclusion word.
 
     Uses case-insensitive word boundary matching to avoid partial matches.
+    The word list is compiled once (cached per distinct list).
 
     Args:
         text: Text to check for exclusion words.
@@ -163,101 +180,17 @@ def contains_exclusion_word(text: str, exclusion_words: list[str]) -> tuple[bool
     if not exclusion_words:
         return False, None
 
+    combined, per_word = _build_exclusion_re(tuple(exclusion_words))
     text_lower = text.lower()
-    for word in exclusion_words:
-        word_lower = word.strip().lower()
-        if not word_lower:
-            continue
-        # Use word boundary regex for single words, simple contains for phrases
-        if " " in word_lower:
-            # For phrases, use simple substring matching
-            if word_lower in text_lower:
-                return True, word
-        else:
-            # For single words, use word boundary matching
-            pattern = rf"\b{re.escape(word_lower)}\b"
-            if re.search(pattern, text_lower):
-                return True, word
+    if combined is None or not combined.search(text_lower):
+        return False, None
+    # Report the first listed word that matches
+    for word, pattern in per_word:
+        if pattern.search(text_lower):
+            return True, word
     return False, None
 
 
-def normalize_text(text: str) -> str:
-    """Apply strong normalization for matching.
-
-    Steps:
-    1. Convert to lowercase
-    2. Normalize unicode characters (accents, etc.)
-    3. Remove feat/ft/featuring patterns
-    4. Remove punctuation
-    5. Collapse multiple spaces
-    6. Normalize hyphens/dashes to spaces
-    7. Strip leading/trailing whitespace
-
-    Args:
-        text: Original text to normalize.
-
-    Returns:
-        Normalized text for comparison.
-    """
-    # Convert to lowercase
-    result = text.lower()
-
-    # Normalize unicode characters (remove accents)
-    result = unicodedata.normalize("NFKD", result)
-    result = "".join(c for c in result if not unicodedata.combining(c))
-
-    # Remove feat/ft/featuring patterns
-    result = FEAT_PATTERNS.sub("", result)
-
-    # Remove parenthetical content for base comparison
-    result = PARENTHETICAL_PATTERN.sub("", result)
-
-    # Normalize hyphens and dashes to spaces
-    result = re.sub(r"[-–—_]+", " ", result)
-
-    # Remove punctuation (keep alphanumeric and spaces)
-    result = re.sub(r"[^\w\s]", "", result)
-
-    # Collapse multiple spaces
-    result = re.sub(r"\s+", " ", result)
-
-    # Strip whitespace
-    return result.strip()
-
-
-def extract_base_name(text: str) -> str:
-    """Extract the base name from a text, removing version suffixes.
-
-    This is used to compare base song/item names without extras like
-    "(Remastered 2011)" or "[Official Audio]".
-
-    Args:
-        text: Original text.
-
-    Returns:
-        Base name without version suffixes.
-    """
-    # Remove parenthetical and bracket content
-    result = PARENTHETICAL_PATTERN.sub("", text)
-    # Remove feat patterns
-    result = FEAT_PATTERNS.sub("", result)
-    # Normalize
-    return normalize_text(result)
-
-
-def tokenize(text: str) -> set[str]:
-    """Split normalized text into a set of tokens.
-
-    Args:
-        text: Normalized text.
-
-    Returns:
-        Set of word tokens.
-    """
-    normalized = normalize_text(text)
-    return set(normalized.split())
-
-
 def get_penalty_words_in_text(text: str) -> set[str]:
     """Find penalty words present in the text.
 
@@ -270,14 +203,7 @@ def get_penalty_words_in_text(text: str) -> set[str]:
     Returns:
         Set of penalty words found in text.
     """
-    text_lower = text.lower()
-    result = set()
-    for word in PENALTY_WORDS:
-        # Use word boundary regex to avoid partial matches
-        pattern = rf"\b{re.escape(word)}\b"
-        if re.search(pattern, text_lower):
-            result.add(word)
-    return result
+    return set(classify_tokens(text)[0])
 
 
 def get_bonus_words_in_text(text: str) -> set[str]:
@@ -292,36 +218,83 @@ def get_bonus_words_in_text(text: str) -> set[str]:
     Returns:
         Set of bonus words found in text.
     """
-    text_lower = text.lower()
-    result = set()
-    for word in BONUS_WORDS:
-        # Use word boundary regex to avoid partial matches
-        pattern = rf"\b{re.escape(word)}\b"
-        if re.search(pattern, text_lower):
-            result.add(word)
-    return result
+    return set(classify_tokens(text)[1])
+
 
+def _indel_distance(str1: str, str2: str) -> int:
+    """Calculate the insertion/deletion edit distance between two strings.
+
+    The distance is len1 + len2 - 2 * LCS. The LCS length is computed with
+    the bit-parallel algorithm of Hyyrö (2004), using a Python int as the
+    bit vector over str1, so each character of str2 costs a few big-int
+    operations instead of a DP row.
+
+    Args:
+        str1: First string.
+        str2: Second string.
+
+    Returns:
+        The indel distance.
+    """
+    if not str1 or not str2:
+        return len(str1) + len(str2)
 
-def fuzzy_ratio(str1: str, str2: str) -> float:
+    # Bit i of a character's mask is set where str1[i] is that character
+    masks: dict[str, int] = {}
+    for i, char in enumerate(str1):
+        masks[char] = masks.get(char, 0) | (1 << i)
+
+    full = (1 << len(str1)) - 1
+    row = full
+    for char in str2:
+        matches = row & masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & full
+
+    lcs = len(str1) - row.bit_count()
+    return len(str1) + len(str2) - 2 * lcs
+
+
+def _indel_ratio(str1: str, str2: str, score_cutoff: float) -> float:
+    """Calculate a normalized indel similarity (0-100), like rapidfuzz's ratio.
+
+    Pairs that cannot reach score_cutoff are rejected early and return 0.0.
+    """
+    total = len(str1) + len(str2)
+    if not total:
+        return 100.0
+    max_dist = int(total * (100 - score_cutoff) / 100)
+    if abs(len(str1) - len(str2)) > max_dist:
+        # The distance is at least the length difference
+        return 0.0
+    dist = _indel_distance(str1, str2)
+    if dist > max_dist:
+        return 0.0
+    score = (1 - dist / total) * 100
+    return score if score >= score_cutoff else 0.0
+
+
+def fuzzy_ratio(str1: str, str2: str, score_cutoff: float = 0.0) -> float:
     """Calculate fuzzy similarity ratio between two strings.
 
-    Uses rapidfuzz if available, otherwise falls back to difflib.
+    Uses rapidfuzz (a core dependency); if it cannot be imported, falls
+    back to a pure-Python indel distance with the same normalization.
 
     Args:
         str1: First string.
         str2: Second string.
+        score_cutoff: Scores below this value are reported as 0.0, which
+            lets the scorer stop early on pairs that cannot reach it.
 
     Returns:
         Similarity ratio from 0.0 to 100.0.
     """
     if RAPIDFUZZ_AVAILABLE:
-        return rapidfuzz_fuzz.ratio(str1, str2)
+        return rapidfuzz_fuzz.ratio(str1, str2, score_cutoff=score_cutoff)
     else:
-        # difflib returns 0.0-1.0, we need 0-100
-        return difflib.SequenceMatcher(None, str1, str2).ratio() * 100
+        return _indel_ratio(str1, str2, score_cutoff)
 
 
-def token_sort_ratio(str1: str, str2: str) -> float:
+def token_sort_ratio(str1: str, str2: str, score_cutoff: float = 0.0) -> float:
     """Calculate token sort similarity ratio.
 
     Sorts words alphabetically before comparing, which helps
@@ -330,20 +303,21 @@ def token_sort_ratio(str1: str, str2: str) -> float:
     Args:
         str1: First string.
         str2: Second string.
+        score_cutoff: Scores below this value are reported as 0.0.
 
     Returns:
         Similarity ratio from 0.0 to 100.0.
     """
     if RAPIDFUZZ_AVAILABLE:
-        return rapidfuzz_fuzz.token_sort_ratio(str1, str2)
+        return rapidfuzz_fuzz.token_sort_ratio(str1, str2, score_cutoff=score_cutoff)
     else:
-        # Manual implementation for difflib fallback
+        # Manual implementation for the pure-Python fallback
         sorted1 = " ".join(sorted(str1.split()))
         sorted2 = " ".join(sorted(str2.split()))
-        return difflib.SequenceMatcher(None, sorted1, sorted2).ratio() * 100
+        return _indel_ratio(sorted1, sorted2, score_cutoff)
 
 
-def token_set_ratio(str1: str, str2: str) -> float:
+def token_set_ratio(str1: str, str2: str, score_cutoff: float = 0.0) -> float:
     """Calculate token set similarity ratio.
 
     Uses set intersection of tokens for comparison.
@@ -351,14 +325,15 @@ def token_set_ratio(str1: str, str2: str) -> float:
     Args:
         str1: First string.
         str2: Second string.
+        score_cutoff: Scores below this value are reported as 0.0.
 
     Returns:
         Similarity ratio from 0.0 to 100.0.
     """
     if RAPIDFUZZ_AVAILABLE:
-        return rapidfuzz_fuzz.token_set_ratio(str1, str2)
+        return rapidfuzz_fuzz.token_set_ratio(str1, str2, score_cutoff=score_cutoff)
     else:
-        # Manual implementation for difflib fallback
+        # Manual implementation for the pure-Python fallback
         tokens1 = set(str1.split())
         tokens2 = set(str2.split())
         intersection = tokens1 & tokens2
@@ -366,10 +341,62 @@ def token_set_ratio(str1: str, str2: str) -> float:
             return 0.0
         # Jaccard-like similarity
         union = tokens1 | tokens2
-        return (len(intersection) / len(union)) * 100
+        score = (len(intersection) / len(union)) * 100
+        return score if score >= score_cutoff else 0.0
 
 
-@dataclass
+def similarity_scores(query: str, choices: list[str], score_cutoff: float = 0.0) -> list[float]:
+    """Calculate the best base similarity of a query against many choices.
+
+    The base similarity is the maximum of fuzzy_ratio, token_sort_ratio and
+    token_set_ratio. With rapidfuzz each scorer runs over all choices in a
+    single batch call instead of one Python-level call per pair.
+
+    Args:
+        query: Normalized query text.
+        choices: Normalized candidate texts.
+        score_cutoff: Scores below this value are reported as 0.0.
+
+    Returns:
+        List of similarity scores (0.0 to 100.0), aligned with choices.
+    """
+    if not RAPIDFUZZ_AVAILABLE:
+        # ratio and token_sort_ratio compare strings of the same lengths, and
+        # their score is bounded by 200 * shorter / (len1 + len2), so choices
+        # outside [lo, hi] only need the token set comparison.
+        query_len = len(query)
+        if score_cutoff > 0:
+            lo = score_cutoff * query_len / (200 - score_cutoff)
+            hi = query_len * (200 - score_cutoff) / score_cutoff
+        else:
+            lo, hi = 0.0, float("inf")
+        scores = []
+        for c in choices:
+            score = token_set_ratio(query, c, score_cutoff)
+            if lo <= len(c) <= hi:
+                score = max(
+                    score,
+                    fuzzy_ratio(query, c, score_cutoff),
+                    token_sort_ratio(query, c, score_cutoff),
+                )
+            scores.append(score)
+        return scores
+
+    scores = [0.0] * len(choices)
+    for scorer in (
+        rapidfuzz_fuzz.ratio,
+        rapidfuzz_fuzz.token_sort_ratio,
+        rapidfuzz_fuzz.token_set_ratio,
+    ):
+        for _, score, index in rapidfuzz_process.extract(
+            query, choices, scorer=scorer, limit=None, score_cutoff=score_cutoff
+        ):
+            if score > scores[index]:
+                scores[index] = score
+    return scores
+
+
+@dataclass(slots=True)
 class MatchCandidate:
     """A candidate match from the catalog."""
 
@@ -394,7 +421,7 @@ class MatchCandidate:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of matching a requested item against the catalog."""
 
@@ -415,9 +442,11 @@ class MatchResult:
 
 def _calculate_score(
     requested_normalized: str,
-    candidate_normalized: str,
-    candidate_original: str,
+    candidate: MediaFile,
     item_type: RequestedItemType,
+    base_score: float | None = None,
+    *,
+    explain: bool = True,
 ) -> tuple[float, str, list[str], list[str]]:
     """Calculate match score between requested item and candidate.
 
@@ -430,9 +459,12 @@ def _calculate_score(
 
     Args:
         requested_normalized: Normalized requested text.
-        candidate_normalized: Normalized candidate text.
-        candidate_original: Original candidate text (for penalty detection).
+        candidate: Catalog file being scored; its precomputed matching keys
+            (normalized name, tokens, penalty/bonus words) are reused.
         item_type: Type of the requested item.
+        base_score: Precomputed base similarity (see similarity_scores).
+            Calculated here when not provided.
+        explain: Whether to build the reason text; the score is the same.
 
     Returns:
         Tuple of (score, reason, penalties, bonuses).
@@ -440,25 +472,23 @@ def _calculate_score(
     penalties: list[str] = []
     bonuses: list[str] = []
     reasons: list[str] = []
+    candidate_normalized = candidate.normalized_name
 
-    # Calculate multiple fuzzy ratios and use the best
-    ratio = fuzzy_ratio(requested_normalized, candidate_normalized)
-    token_sort = token_sort_ratio(requested_normalized, candidate_normalized)
-    token_set = token_set_ratio(requested_normalized, candidate_normalized)
-
-    # Take the best of different algorithms
-    base_score = max(ratio, token_sort, token_set)
-    reasons.append(f"similaridad base: {base_score:.1f}%")
+    # Calculate multiple fuzzy ratios and take the best of the algorithms
+    if base_score is None:
+        base_score = similarity_scores(requested_normalized, [candidate_normalized])[0]
+    if explain:
+        reasons.append(f"similaridad base: {base_score:.1f}%")
 
     # Token overlap bonus
     req_tokens = tokenize(requested_normalized)
-    cand_tokens = tokenize(candidate_normalized)
+    cand_tokens = candidate.tokens
     if req_tokens and cand_tokens:
         common_tokens = req_tokens & cand_tokens
         token_overlap = len(common_tokens) / max(len(req_tokens), len(cand_tokens))
         token_bonus = token_overlap * 10  # Up to 10 points
         base_score += token_bonus
-        if token_bonus > 0:
+        if token_bonus > 0 and explain:
             reasons.append(f"tokens comunes: {len(common_tokens)}")
 
     # Length similarity bonus (prefer similar length)
@@ -471,19 +501,17 @@ def _calculate_score(
 
     # Apply penalties for songs
     if item_type == RequestedItemType.SONG:
-        penalty_words_found = get_penalty_words_in_text(candidate_original)
-        for word in penalty_words_found:
+        for word in candidate.penalties:
             base_score -= 15  # Significant penalty
             penalties.append(word)
-        if penalties:
+        if penalties and explain:
             reasons.append(f"penalización por: {', '.join(penalties)}")
 
     # Apply bonuses for quality indicators
-    bonus_words_found = get_bonus_words_in_text(candidate_original)
-    for word in bonus_words_found:
+    for word in candidate.bonuses:
         base_score += 5  # Small bonus
         bonuses.append(word)
-    if bonuses:
+    if bonuses and explain:
         reasons.append(f"bonus por: {', '.join(bonuses)}")
 
     # Clamp score to 0-100 range
@@ -493,31 +521,59 @@ def _calculate_score(
     return final_score, reason, penalties, bonuses
 
 
-def match_single_item(
-    item: RequestedItem,
-    catalog: MediaCatalog,
-    threshold: float = 60.0,
-    max_candidates: int = 10,
-    rules: CopyRules | None = None,
-) -> MatchResult:
-    """Match a single requested item against the catalog.
+@dataclass(slots=True)
+class _EligibleFiles:
+    """Catalog files that pass the copy rules, prepared for scoring.
+
+    The same song often appears several times (other folders, formats), so
+    fuzzy scoring runs over the distinct normalized names only; name_index
+    maps each file to its entry in names.
+    """
+
+    files: list[MediaFile]
+    names: list[str]
+    name_index: list[int]
+    max_bonuses: int
+
+
+def _extension_sets(
+    blocked: list[str], allowed: list[str]
+) -> tuple[frozenset[str], frozenset[str] | None]:
+    """Normalize an extension blacklist/whitelist pair into lookup sets.
 
     Args:
-        item: The requested item to match.
-        catalog: Media catalog to search.
-        threshold: Minimum similarity threshold (0-100).
-        max_candidates: Maximum number of candidates to return.
-        rules: Optional copy rules for filtering by exclusion words.
+        blocked: Blocked extensions; they match with or without leading dot.
+        allowed: Allowed extensions; empty means every extension is allowed.
 
     Returns:
-        MatchResult with ranked candidates.
+        Tuple of (blocked, allowed) lowercased sets, where allowed is None
+        when there is no whitelist.
     """
-    from mediacopier.core.indexer import MediaType
+    blocked_set: set[str] = set()
+    for b in (e.lower() for e in blocked):
+        blocked_set.add(b)
+        # Also add version with/without leading dot
+        blocked_set.add(b[1:] if b.startswith(".") else f".{b}")
+    allowed_set = None
+    if allowed:
+        allowed_lower = (e.lower() for e in allowed)
+        allowed_set = frozenset(e if e.startswith(".") else f".{e}" for e in allowed_lower)
+    return frozenset(blocked_set), allowed_set
 
-    result = MatchResult(requested_item=item)
-    requested_normalized = normalize_text(item.texto_original)
-    requested_base = extract_base_name(item.texto_original)
 
+def _prepare_eligible(catalog: MediaCatalog, rules: CopyRules | None) -> _EligibleFiles:
+    """Filter the catalog by exclusion words and extension rules.
+
+    The result does not depend on the requested item, so match_items
+    computes it once for the whole batch.
+
+    Args:
+        catalog: Media catalog to search.
+        rules: Optional copy rules for filtering by exclusion words.
+
+    Returns:
+        The eligible files with their normalized names.
+    """
     # Get exclusion words from rules or use defaults
     exclusion_words: list[str] = []
     if rules and rules.excluir_palabras:
@@ -525,7 +581,17 @@ def match_single_item(
     else:
         exclusion_words = list(DEFAULT_EXCLUSION_WORDS)
 
-    candidates: list[MatchCandidate] = []
+    # Extension lists are normalized into sets once instead of per file
+    extension_rules: dict[MediaType, tuple[frozenset[str], frozenset[str] | None]] = {}
+    if rules:
+        extension_rules[MediaType.AUDIO] = _extension_sets(
+            rules.extensiones_audio_bloqueadas, rules.extensiones_audio_permitidas
+        )
+        extension_rules[MediaType.VIDEO] = _extension_sets(
+            rules.extensiones_video_bloqueadas, rules.extensiones_video_permitidas
+        )
+
+    eligible: list[MediaFile] = []
 
     for media_file in catalog.archivos:
         # Check exclusion words - skip files with junk content
@@ -537,130 +603,203 @@ def match_single_item(
                 continue  # Skip this file, it contains an exclusion word
 
         # Check extension whitelist/blacklist by media type if rules provided
-        if rules:
+        extension_sets = extension_rules.get(media_file.tipo)
+        if extension_sets:
+            blocked, allowed = extension_sets
             ext = media_file.extension.lower()
-            # Helper to normalize extension (remove single leading dot)
             ext_no_dot = ext[1:] if ext.startswith(".") else ext
-            if media_file.tipo == MediaType.AUDIO:
-                # Check audio blacklist
-                if rules.extensiones_audio_bloqueadas:
-                    blocked = [e.lower() for e in rules.extensiones_audio_bloqueadas]
-                    blocked_normalized = []
-                    for b in blocked:
-                        blocked_normalized.append(b)
-                        # Also add version with/without leading dot
-                        if b.startswith("."):
-                            blocked_normalized.append(b[1:])
-                        else:
-                            blocked_normalized.append(f".{b}")
-                    if ext in blocked_normalized or ext_no_dot in blocked_normalized:
-                        continue
-                # Check audio whitelist (if specified, only allow these)
-                if rules.extensiones_audio_permitidas:
-                    allowed = [e.lower() for e in rules.extensiones_audio_permitidas]
-                    allowed_normalized = [e if e.startswith(".") else f".{e}" for e in allowed]
-                    if ext not in allowed_normalized:
-                        continue
-            elif media_file.tipo == MediaType.VIDEO:
-                # Check video blacklist
-                if rules.extensiones_video_bloqueadas:
-                    blocked = [e.lower() for e in rules.extensiones_video_bloqueadas]
-                    blocked_normalized = []
-                    for b in blocked:
-                        blocked_normalized.append(b)
-                        # Also add version with/without leading dot
-                        if b.startswith("."):
-                            blocked_normalized.append(b[1:])
-                        else:
-                            blocked_normalized.append(f".{b}")
-                    if ext in blocked_normalized or ext_no_dot in blocked_normalized:
-                        continue
-                # Check video whitelist (if specified, only allow these)
-                if rules.extensiones_video_permitidas:
-                    allowed = [e.lower() for e in rules.extensiones_video_permitidas]
-                    allowed_normalized = [e if e.startswith(".") else f".{e}" for e in allowed]
-                    if ext not in allowed_normalized:
-                        continue
-
-        candidate_normalized = normalize_text(media_file.nombre_base)
-        candidate_base = extract_base_name(media_file.nombre_base)
+            if ext in blocked or ext_no_dot in blocked:
+                continue
+            # If a whitelist is specified, only allow these
+            if allowed is not None and ext not in allowed:
+                continue
 
-        # Check for exact match (normalized base names are equal)
-        is_exact = (requested_base == candidate_base) or (
-            requested_normalized == candidate_normalized
-        )
+        eligible.append(media_file)
 
-        # Calculate score
-        score, reason, penalties, bonuses = _calculate_score(
-            requested_normalized,
-            candidate_normalized,
-            media_file.nombre_base,
-            item.tipo,
-        )
+    positions: dict[str, int] = {}
+    name_index = [
+        positions.setdefault(media_file.normalized_name, len(positions)) for media_file in eligible
+    ]
+
+    return _EligibleFiles(
+        files=eligible,
+        names=list(positions),
+        name_index=name_index,
+        max_bonuses=max((len(mf.bonuses) for mf in eligible), default=0),
+    )
+
+
+def match_single_item(
+    item: RequestedItem,
+    catalog: MediaCatalog,
+    threshold: float = 60.0,
+    max_candidates: int = 10,
+    rules: CopyRules | None = None,
+) -> MatchResult:
+    """Match a single requested item against the catalog.
 
-        # Apply movie quality scoring for MOVIE type
-        if item.tipo == RequestedItemType.MOVIE and rules:
-            resolution_from_name = extract_resolution_from_name(media_file.nombre_base)
-            video_width = None
-            video_height = None
-            video_codec = None
-
-            if media_file.video_meta:
-                video_width = media_file.video_meta.width
-                video_height = media_file.video_meta.height
-                video_codec = media_file.video_meta.codec
-
-            # Add resolution bonus if preferring high resolution
-            if rules.preferir_resolucion_alta:
-                res_score = get_resolution_score(resolution_from_name, video_width, video_height)
-                # Add bonus based on resolution (up to 10 points)
-                resolution_bonus = (res_score / 100.0) * 10
-                score += resolution_bonus
-                if res_score > 0:
-                    if resolution_from_name:
-                        res_str = resolution_from_name
-                    elif video_height:
-                        res_str = f"{video_height}p"
-                    else:
-                        res_str = "unknown"
-                    reason += f"; resolución: {res_str} (+{resolution_bonus:.1f})"
-
-            # Add codec preference bonus
-            if rules.codecs_preferidos and video_codec:
-                codec_lower = video_codec.lower()
-                for i, preferred in enumerate(rules.codecs_preferidos):
-                    if preferred.lower() in codec_lower:
-                        # Earlier in list = more preferred
-                        codec_bonus = 5 - (i * 0.5)  # 5, 4.5, 4, 3.5...
-                        codec_bonus = max(0, codec_bonus)
-                        score += codec_bonus
+    Args:
+        item: The requested item to match.
+        catalog: Media catalog to search.
+        threshold: Minimum similarity threshold (0-100).
+        max_candidates: Maximum number of candidates to return.
+        rules: Optional copy rules for filtering by exclusion words.
+
+    Returns:
+        MatchResult with ranked candidates.
+    """
+    return _match_eligible(
+        item, _prepare_eligible(catalog, rules), threshold, max_candidates, rules
+    )
+
+
+def _score_candidate(
+    item: RequestedItem,
+    media_file: MediaFile,
+    requested_normalized: str,
+    is_exact: bool,
+    base_score: float | None,
+    rules: CopyRules | None,
+    *,
+    explain: bool = True,
+) -> tuple[float, str, list[str], list[str]]:
+    """Score one catalog file, including movie quality and exact-match rules.
+
+    Args:
+        item: The requested item.
+        media_file: Catalog file being scored.
+        requested_normalized: Normalized requested text.
+        is_exact: Whether the file is an exact match of the request.
+        base_score: Precomputed base similarity, or None to calculate it.
+        rules: Optional copy rules with movie quality preferences.
+        explain: Whether to build the reason text; the score is the same.
+
+    Returns:
+        Tuple of (score, reason, penalties, bonuses).
+    """
+    score, reason, penalties, bonuses = _calculate_score(
+        requested_normalized, media_file, item.tipo, base_score, explain=explain
+    )
+
+    # Apply movie quality scoring for MOVIE type
+    if item.tipo == RequestedItemType.MOVIE and rules:
+        resolution_from_name = extract_resolution_from_name(media_file.nombre_base)
+        video_width = None
+        video_height = None
+        video_codec = None
+
+        if media_file.video_meta:
+            video_width = media_file.video_meta.width
+            video_height = media_file.video_meta.height
+            video_codec = media_file.video_meta.codec
+
+        # Add resolution bonus if preferring high resolution
+        if rules.preferir_resolucion_alta:
+            res_score = get_resolution_score(resolution_from_name, video_width, video_height)
+            # Add bonus based on resolution (up to 10 points)
+            resolution_bonus = (res_score / 100.0) * 10
+            score += resolution_bonus
+            if res_score > 0 and explain:
+                if resolution_from_name:
+                    res_str = resolution_from_name
+                elif video_height:
+                    res_str = f"{video_height}p"
+                else:
+                    res_str = "unknown"
+                reason += f"; resolución: {res_str} (+{resolution_bonus:.1f})"
+
+        # Add codec preference bonus
+        if rules.codecs_preferidos and video_codec:
+            codec_lower = video_codec.lower()
+            for i, preferred in enumerate(rules.codecs_preferidos):
+                if preferred.lower() in codec_lower:
+                    # Earlier in list = more preferred
+                    codec_bonus = 5 - (i * 0.5)  # 5, 4.5, 4, 3.5...
+                    codec_bonus = max(0, codec_bonus)
+                    score += codec_bonus
+                    if explain:
                         reason += f"; codec preferido: {video_codec} (+{codec_bonus:.1f})"
-                        break
+                    break
 
-        if is_exact:
-            score = max(score, 95.0)  # Exact matches get high base score
+    if is_exact:
+        score = max(score, 95.0)  # Exact matches get high base score
+        if explain:
             reason = f"coincidencia exacta; {reason}"
 
+    return score, reason, penalties, bonuses
+
+
+def _match_eligible(
+    item: RequestedItem,
+    eligible: _EligibleFiles,
+    threshold: float,
+    max_candidates: int,
+    rules: CopyRules | None,
+) -> MatchResult:
+    """Rank the prepared eligible files against a single requested item."""
+    result = MatchResult(requested_item=item)
+    requested_normalized = normalize_text(item.texto_original)
+    requested_base = extract_base_name(item.texto_original)
+
+    # Upper bound of what can be added on top of the base similarity: token
+    # overlap (10), length (5), bonus words (5 each) and, for movies, the
+    # resolution (10) and codec (5) bonuses. Pairs whose base similarity is
+    # below threshold minus that bound can never be accepted.
+    max_extra = 15.0 + 5.0 * eligible.max_bonuses
+    if item.tipo == RequestedItemType.MOVIE and rules:
+        max_extra += 15.0
+    score_cutoff = max(0.0, threshold - max_extra)
+
+    # Score each distinct eligible name against the request in one batch
+    name_scores = similarity_scores(
+        requested_normalized, choices=eligible.names, score_cutoff=score_cutoff
+    )
+    base_scores = [name_scores[i] for i in eligible.name_index]
+
+    scored: list[tuple[float, bool, MediaFile, float | None]] = []
+
+    for media_file, base_score in zip(eligible.files, base_scores):
+        # Check for exact match (normalized base names are equal)
+        is_exact = (requested_base == media_file.base_name) or (
+            requested_normalized == media_file.normalized_name
+        )
+        if base_score < score_cutoff:
+            if not is_exact:
+                # Even the largest possible adjustment cannot reach threshold
+                continue
+            # Exact matches bypass the threshold; report their real similarity
+            base_score = None
+
+        score = _score_candidate(
+            item, media_file, requested_normalized, is_exact, base_score, rules, explain=False
+        )[0]
+
         # Skip if below threshold (unless exact match)
         if score < threshold and not is_exact:
             continue
 
-        candidate = MatchCandidate(
-            media_file=media_file,
-            score=score,
-            reason=reason,
-            is_exact=is_exact,
-            normalized_name=candidate_normalized,
-            penalties=penalties,
-            bonuses=bonuses,
-        )
-        candidates.append(candidate)
+        scored.append((score, is_exact, media_file, base_score))
 
-    # Sort by score (descending), then by whether it's exact
-    candidates.sort(key=lambda c: (c.score, c.is_exact), reverse=True)
+    # Keep the top candidates by score (descending), then by whether it's exact.
+    # nlargest avoids sorting everything and keeps ties in catalog order
+    top = heapq.nlargest(max_candidates, scored, key=lambda s: (s[0], s[1]))
 
-    # Limit candidates
-    result.candidates = candidates[:max_candidates]
+    # Reasons are only built for the candidates that are returned
+    for score, is_exact, media_file, base_score in top:
+        _, reason, penalties, bonuses = _score_candidate(
+            item, media_file, requested_normalized, is_exact, base_score, rules, explain=True
+        )
+        result.candidates.append(
+            MatchCandidate(
+                media_file=media_file,
+                score=score,
+                reason=reason,
+                is_exact=is_exact,
+                normalized_name=media_file.normalized_name,
+                penalties=penalties,
+                bonuses=bonuses,
+            )
+        )
 
     if result.candidates:
         result.best_match = result.candidates[0]
@@ -697,22 +836,40 @@ def match_items(
     if rules and rules.solo_mejor_match:
         effective_max_candidates = 1
 
+    # The rule filtering does not depend on the request, so do it once
+    eligible = _prepare_eligible(catalog, rules)
+
+    # Requests that normalize to the same query are only scored once
+    matched: dict[tuple[RequestedItemType, str, str], MatchResult] = {}
+
     for item in requested_items:
-        result = match_single_item(
-            item=item,
-            catalog=catalog,
-            threshold=threshold,
-            max_candidates=effective_max_candidates,
-            rules=rules,
-        )
+        text = item.texto_original
+        key = (item.tipo, normalize_text(text), extract_base_name(text))
+        previous = matched.get(key)
+        if previous is not None:
+            results.append(
+                MatchResult(
+                    requested_item=item,
+                    candidates=list(previous.candidates),
+                    best_match=previous.best_match,
+                    match_found=previous.match_found,
+                )
+            )
+            continue
+
+        result = _match_eligible(item, eligible, threshold, effective_max_candidates, rules)
+        matched[key] = result
         results.append(result)
 
     return results
 
 
+@lru_cache(maxsize=4096)
 def explain_match(requested: str, matched: str, item_type: RequestedItemType) -> str:
     """Generate a human-readable explanation of why a match was chosen.
 
+    The explanation only depends on its arguments, so results are memoized.
+
     Args:
         requested: Original requested text.
         matched: The matched text.
@@ -740,13 +897,12 @@ def explain_match(requested: str, matched: str, item_type: RequestedItemType) ->
         explanations.append(f"comparte {len(common)} palabras en común: {common_str}")
 
     # Check for quality indicators
-    bonuses = get_bonus_words_in_text(matched)
+    penalties, bonuses = classify_tokens(matched)
     if bonuses:
         explanations.append(f"tiene indicadores de calidad: {', '.join(bonuses)}")
 
     # Check for penalties
     if item_type == RequestedItemType.SONG:
-        penalties = get_penalty_words_in_text(matched)
         if penalties:
             explanations.append(f"NOTA: contiene: {', '.join(penalties)} (puntuación reducida)")
 
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import importlib
+import importlib.util
 import re
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-# Try to use mutagen for metadata extraction
-try:
+if TYPE_CHECKING:
+    # Bound at runtime on first use by _load_mutagen()/__getattr__ below
     import mutagen
     from mutagen.easyid3 import EasyID3
     from mutagen.flac import FLAC
@@ -16,9 +20,58 @@ try:
     from mutagen.mp4 import MP4
     from mutagen.wave import WAVE
 
-    MUTAGEN_AVAILABLE = True
-except ImportError:
-    MUTAGEN_AVAILABLE = False
+# mutagen is optional; its modules are imported on first extraction so that
+# filename parsing and AudioMeta do not pay for the import. The flag only
+# reflects that mutagen is installed, not that it imported; _load_mutagen()
+# reports whether the import actually succeeded
+MUTAGEN_AVAILABLE = importlib.util.find_spec("mutagen") is not None
+
+# Module attribute -> (module to import, attribute in that module or None for the module)
+_MUTAGEN_ATTRS = {
+    "mutagen": ("mutagen", None),
+    "EasyID3": ("mutagen.easyid3", "EasyID3"),
+    "FLAC": ("mutagen.flac", "FLAC"),
+    "MP3": ("mutagen.mp3", "MP3"),
+    "MP4": ("mutagen.mp4", "MP4"),
+    "WAVE": ("mutagen.wave", "WAVE"),
+}
+# Result of the first _load_mutagen() call; None until it has been tried
+_mutagen_loaded: bool | None = None
+
+
+def __getattr__(name: str) -> Any:
+    """Import mutagen classes lazily on first module attribute access."""
+    if name in _MUTAGEN_ATTRS:
+        module_name, attr = _MUTAGEN_ATTRS[name]
+        module = importlib.import_module(module_name)
+        value = module if attr is None else getattr(module, attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _load_mutagen() -> bool:
+    """Bind the mutagen classes used by the extractors as module globals.
+
+    Names already bound (e.g. patched in tests) are left untouched. The
+    import is attempted once; a failure is remembered and not retried.
+
+    Returns:
+        True if mutagen could be imported, False otherwise.
+    """
+    global _mutagen_loaded
+    if _mutagen_loaded is None:
+        module_globals = globals()
+        try:
+            for name in _MUTAGEN_ATTRS:
+                if name not in module_globals:
+                    __getattr__(name)
+        except ImportError:
+            _mutagen_loaded = False
+        else:
+            _mutagen_loaded = True
+    return _mutagen_loaded
+
 
 # Unknown values for fallback
 UNKNOWN_GENRE = "Unknown Genre"
@@ -26,11 +79,18 @@ UNKNOWN_ARTIST = "Unknown Artist"
 UNKNOWN_TITLE = "Unknown Title"
 UNKNOWN_ALBUM = "Unknown Album"
 
+# Organization prefix for files without metadata (both names are already path-safe)
+_UNKNOWN_PREFIX = f"{UNKNOWN_GENRE}/{UNKNOWN_ARTIST}"
+
 # Pattern to parse "Artist - Title" from filename
 ARTIST_TITLE_PATTERN = re.compile(r"^(.+?)\s*[-–—]\s*(.+)$")
+_ARTIST_TITLE_DASHES = ("-", "–", "—")
 
+# Characters not allowed in path components, mapped to "_" in one pass
+_PATH_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
 
-@dataclass
+
+@dataclass(slots=True)
 class AudioMeta:
     """Audio metadata for a media file."""
 
@@ -89,6 +149,37 @@ class AudioMeta:
         return self.artist if self.has_artist else UNKNOWN_ARTIST
 
 
+def _split_artist_title(name: str) -> tuple[str, str] | None:
+    """Split "Artist - Title" at the first usable dash.
+
+    Equivalent to ARTIST_TITLE_PATTERN: the separator is the first dash with at
+    least one character on each side. Uses str.find instead of the regex
+    engine; multi-line input keeps the pattern's line semantics.
+
+    Args:
+        name: Stripped filename stem.
+
+    Returns:
+        Tuple of (artist, title) before stripping, or None if there is no separator.
+    """
+    if "\n" in name:
+        match = ARTIST_TITLE_PATTERN.match(name)
+        return (match.group(1), match.group(2)) if match else None
+
+    if name.isascii():
+        # En/em dashes are not ASCII, so only "-" can occur
+        separator = name.find("-", 1)
+    else:
+        separator = -1
+        for dash in _ARTIST_TITLE_DASHES:
+            index = name.find(dash, 1)
+            if index != -1 and (separator == -1 or index < separator):
+                separator = index
+    if separator == -1 or separator == len(name) - 1:
+        return None
+    return name[:separator], name[separator + 1 :]
+
+
 def parse_artist_title_from_filename(filename: str) -> tuple[str, str]:
     """Parse artist and title from a filename in "Artist - Title" format.
 
@@ -103,21 +194,21 @@ def parse_artist_title_from_filename(filename: str) -> tuple[str, str]:
     # Remove common file extensions if present in the stem
     clean_name = filename.strip()
 
-    match = ARTIST_TITLE_PATTERN.match(clean_name)
-    if match:
-        artist = match.group(1).strip()
-        title = match.group(2).strip()
+    parts = _split_artist_title(clean_name)
+    if parts:
+        artist = parts[0].strip()
+        title = parts[1].strip()
         return (artist if artist else UNKNOWN_ARTIST, title if title else UNKNOWN_TITLE)
 
     # If no pattern match, return unknown artist and filename as title
     return (UNKNOWN_ARTIST, clean_name if clean_name else UNKNOWN_TITLE)
 
 
-def _get_first_tag(tags: dict, keys: list[str]) -> str:
+def _get_first_tag(tags: Mapping[str, Any], keys: list[str]) -> str:
     """Get the first available tag value from a list of possible keys.
 
     Args:
-        tags: Dictionary of tags.
+        tags: Mapping of tags; mutagen tag objects can be passed directly.
         keys: List of keys to try.
 
     Returns:
@@ -152,7 +243,7 @@ def _extract_mp3_metadata(file_path: Path) -> AudioMeta:
 
         # Tags from EasyID3
         if audio.tags:
-            tags = dict(audio.tags)
+            tags = audio.tags
             meta.artist = _get_first_tag(tags, ["artist", "albumartist"])
             meta.title = _get_first_tag(tags, ["title"])
             meta.album = _get_first_tag(tags, ["album"])
@@ -189,7 +280,7 @@ def _extract_m4a_metadata(file_path: Path) -> AudioMeta:
 
         # Tags from MP4
         if audio.tags:
-            tags = dict(audio.tags)
+            tags = audio.tags
             meta.artist = _get_first_tag(tags, ["\xa9ART", "aART"])
             meta.title = _get_first_tag(tags, ["\xa9nam"])
             meta.album = _get_first_tag(tags, ["\xa9alb"])
@@ -272,7 +363,7 @@ def _extract_wav_metadata(file_path: Path) -> AudioMeta:
 
         # WAV files can have ID3 tags
         if audio.tags:
-            tags = dict(audio.tags)
+            tags = audio.tags
             meta.artist = _get_first_tag(tags, ["artist", "albumartist"])
             meta.title = _get_first_tag(tags, ["title"])
             meta.album = _get_first_tag(tags, ["album"])
@@ -286,6 +377,50 @@ def _extract_wav_metadata(file_path: Path) -> AudioMeta:
     return meta
 
 
+def _extract_generic_metadata(file_path: Path) -> AudioMeta | None:
+    """Extract metadata from an unsupported format using generic mutagen.
+
+    Args:
+        file_path: Path to the audio file.
+
+    Returns:
+        AudioMeta with extracted metadata, or None if mutagen cannot read the file.
+    """
+    meta: AudioMeta | None = None
+
+    try:
+        audio = mutagen.File(file_path, easy=True)
+        if audio:
+            meta = AudioMeta()
+            if audio.info:
+                meta.duration_sec = getattr(audio.info, "length", None)
+                bitrate = getattr(audio.info, "bitrate", None)
+                meta.bitrate_kbps = int(bitrate / 1000) if bitrate else None
+            if audio.tags:
+                tags = audio.tags
+                meta.artist = _get_first_tag(tags, ["artist", "albumartist"])
+                meta.title = _get_first_tag(tags, ["title"])
+                meta.album = _get_first_tag(tags, ["album"])
+                meta.genre = _get_first_tag(tags, ["genre"])
+                meta.year = _get_first_tag(tags, ["date", "year"])
+    except Exception:
+        # Best effort - return what we have
+        pass
+
+    return meta
+
+
+# Extractor per lowercase file extension; anything else uses generic mutagen
+_EXTRACTORS_BY_EXTENSION: dict[str, Callable[[Path], AudioMeta | None]] = {
+    ".mp3": _extract_mp3_metadata,
+    ".m4a": _extract_m4a_metadata,
+    ".aac": _extract_m4a_metadata,
+    ".mp4": _extract_m4a_metadata,
+    ".flac": _extract_flac_metadata,
+    ".wav": _extract_wav_metadata,
+}
+
+
 def extract_audio_metadata(file_path: str | Path) -> AudioMeta | None:
     """Extract audio metadata from a file.
 
@@ -299,44 +434,18 @@ def extract_audio_metadata(file_path: str | Path) -> AudioMeta | None:
         AudioMeta with extracted metadata, or None if mutagen is not available
         and the file cannot be processed.
     """
-    path = Path(file_path)
+    # MediaFile.from_path already passes a Path; avoid re-wrapping it
+    path = file_path if isinstance(file_path, Path) else Path(file_path)
     extension = path.suffix.lower()
 
-    if not MUTAGEN_AVAILABLE:
+    if not MUTAGEN_AVAILABLE or not _load_mutagen():
         # Fallback to filename parsing only
         artist, title = parse_artist_title_from_filename(path.stem)
         return AudioMeta(artist=artist, title=title)
 
     # Extract based on file extension
-    meta: AudioMeta | None = None
-
-    if extension == ".mp3":
-        meta = _extract_mp3_metadata(path)
-    elif extension in {".m4a", ".aac", ".mp4"}:
-        meta = _extract_m4a_metadata(path)
-    elif extension == ".flac":
-        meta = _extract_flac_metadata(path)
-    elif extension == ".wav":
-        meta = _extract_wav_metadata(path)
-    else:
-        # Unsupported format - try generic mutagen
-        try:
-            audio = mutagen.File(path, easy=True)
-            if audio:
-                meta = AudioMeta()
-                if audio.info:
-                    meta.duration_sec = getattr(audio.info, "length", None)
-                    bitrate = getattr(audio.info, "bitrate", None)
-                    meta.bitrate_kbps = int(bitrate / 1000) if bitrate else None
-                if audio.tags:
-                    tags = dict(audio.tags)
-                    meta.artist = _get_first_tag(tags, ["artist", "albumartist"])
-                    meta.title = _get_first_tag(tags, ["title"])
-                    meta.album = _get_first_tag(tags, ["album"])
-                    meta.genre = _get_first_tag(tags, ["genre"])
-                    meta.year = _get_first_tag(tags, ["date", "year"])
-        except Exception:
-            pass
+    extractor = _EXTRACTORS_BY_EXTENSION.get(extension, _extract_generic_metadata)
+    meta = extractor(path)
 
     # If no metadata extracted, create empty AudioMeta
     if meta is None:
@@ -368,21 +477,37 @@ def get_organization_path_by_genre(
     Returns:
         A relative path for organizing the file.
     """
-    if audio_meta and audio_meta.has_genre:
+    if audio_meta is None:
+        return f"{_UNKNOWN_PREFIX}/{filename}"
+
+    if audio_meta.has_genre:
         genre = audio_meta.genre
     else:
         genre = UNKNOWN_GENRE
 
-    if audio_meta and audio_meta.has_artist:
+    if audio_meta.has_artist:
         artist = audio_meta.artist
     else:
         artist = UNKNOWN_ARTIST
 
-    # Sanitize for path usage
-    safe_genre = _sanitize_path_component(genre)
-    safe_artist = _sanitize_path_component(artist)
+    return f"{_organization_prefix(genre, artist)}/{filename}"
+
+
+@lru_cache(maxsize=4096)
+def _organization_prefix(genre: str, artist: str) -> str:
+    """Build the sanitized Genre/Artist prefix, cached per pair.
 
-    return f"{safe_genre}/{safe_artist}/{filename}"
+    Tracks from the same album share this prefix, so it is only
+    sanitized once per scan.
+
+    Args:
+        genre: Genre name (already resolved to UNKNOWN_GENRE if missing).
+        artist: Artist name (already resolved to UNKNOWN_ARTIST if missing).
+
+    Returns:
+        The relative "Genre/Artist" prefix.
+    """
+    return f"{_sanitize_path_component(genre)}/{_sanitize_path_component(artist)}"
 
 
 def _sanitize_path_component(name: str) -> str:
@@ -394,12 +519,7 @@ def _sanitize_path_component(name: str) -> str:
     Returns:
         A safe string for use in file paths.
     """
-    # Replace invalid characters with underscore
-    invalid_chars = r'<>:"/\\|?*'
-    result = name
-    for char in invalid_chars:
-        result = result.replace(char, "_")
-    # Remove leading/trailing dots and spaces
-    result = result.strip(". ")
+    # Replace invalid characters with underscore, remove leading/trailing dots and spaces
+    result = name.translate(_PATH_SANITIZE_TABLE).strip(". ")
     # Ensure non-empty
     return result if result else "Unknown"
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+# Use orjson for faster ffprobe JSON decoding when installed
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
 
 def _check_ffprobe_available() -> bool:
     """Check if ffprobe is available on the system.
@@ -30,7 +42,7 @@ def _check_ffprobe_available() -> bool:
 FFPROBE_AVAILABLE = _check_ffprobe_available()
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoMeta:
     """Video metadata for a media file."""
 
@@ -82,6 +94,47 @@ class VideoMeta:
         return None
 
 
+def _to_float(value: Any) -> float | None:
+    """Convert an ffprobe field to float, returning None if it is not numeric.
+
+    ffprobe reports unknown values as "N/A"; that and JSON floats are handled
+    without raising, so the exception path is only taken for malformed data.
+
+    Args:
+        value: Raw field value from the ffprobe JSON.
+
+    Returns:
+        The float value, or None if it cannot be converted.
+    """
+    if isinstance(value, float):
+        return value
+    if value is None or value == "N/A":
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_int(value: Any) -> int | None:
+    """Convert an ffprobe field to int, returning None if it is not integral.
+
+    Args:
+        value: Raw field value from the ffprobe JSON.
+
+    Returns:
+        The int value, or None if it cannot be converted.
+    """
+    if isinstance(value, int):
+        return int(value)
+    if value is None or value == "N/A":
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
 def parse_ffprobe_json(ffprobe_output: dict[str, Any]) -> VideoMeta:
     """Parse ffprobe JSON output and extract video metadata.
 
@@ -91,55 +144,59 @@ def parse_ffprobe_json(ffprobe_output: dict[str, Any]) -> VideoMeta:
     Returns:
         VideoMeta with extracted metadata.
     """
-    meta = VideoMeta()
+    duration_sec: float | None = None
+    width: int | None = None
+    height: int | None = None
+    codec = ""
+    video_stream_count = 0
+    audio_stream_count = 0
 
     # Parse format information for duration
     format_info = ffprobe_output.get("format", {})
     if "duration" in format_info:
-        try:
-            meta.duration_sec = float(format_info["duration"])
-        except (ValueError, TypeError):
-            pass
-
-    # Parse streams information
-    streams = ffprobe_output.get("streams", [])
-    video_stream_count = 0
-    audio_stream_count = 0
+        duration_sec = _to_float(format_info["duration"])
 
-    for stream in streams:
+    # Parse streams information; fields are kept in locals and VideoMeta is
+    # built once at the end
+    for stream in ffprobe_output.get("streams", []):
         codec_type = stream.get("codec_type", "")
 
         if codec_type == "video":
             video_stream_count += 1
             # Get resolution from the first video stream
-            if not meta.has_resolution:
-                try:
-                    width = stream.get("width")
-                    height = stream.get("height")
-                    if width is not None and height is not None:
-                        meta.width = int(width)
-                        meta.height = int(height)
-                except (ValueError, TypeError):
-                    pass
+            if width is None or height is None:
+                stream_width = stream.get("width")
+                stream_height = stream.get("height")
+                if stream_width is not None and stream_height is not None:
+                    parsed_width = _to_int(stream_width)
+                    if parsed_width is not None:
+                        width = parsed_width
+                        parsed_height = _to_int(stream_height)
+                        if parsed_height is not None:
+                            height = parsed_height
 
             # Get codec from the first video stream
-            if not meta.codec:
-                meta.codec = stream.get("codec_name", "")
+            if not codec:
+                codec = stream.get("codec_name", "")
 
             # Try to get duration from video stream if not in format
-            if not meta.has_duration and "duration" in stream:
-                try:
-                    meta.duration_sec = float(stream["duration"])
-                except (ValueError, TypeError):
-                    pass
+            has_duration = duration_sec is not None and duration_sec > 0
+            if not has_duration and "duration" in stream:
+                stream_duration = _to_float(stream["duration"])
+                if stream_duration is not None:
+                    duration_sec = stream_duration
 
         elif codec_type == "audio":
             audio_stream_count += 1
 
-    meta.video_streams = video_stream_count
-    meta.audio_streams = audio_stream_count
-
-    return meta
+    return VideoMeta(
+        duration_sec=duration_sec,
+        width=width,
+        height=height,
+        codec=codec,
+        video_streams=video_stream_count,
+        audio_streams=audio_stream_count,
+    )
 
 
 def _run_ffprobe(file_path: Path) -> dict[str, Any] | None:
@@ -162,16 +219,16 @@ def _run_ffprobe(file_path: Path) -> dict[str, Any] | None:
                 str(file_path),
             ],
             capture_output=True,
-            text=True,
             timeout=30,
         )
 
         if result.returncode != 0:
             return None
 
-        return json.loads(result.stdout)
+        # Decode straight from bytes; both json and orjson accept UTF-8 input
+        return _json_loads(result.stdout)
 
-    except (subprocess.SubprocessError, FileNotFoundError, OSError, json.JSONDecodeError):
+    except (subprocess.SubprocessError, FileNotFoundError, OSError, ValueError):
         return None
 
 
@@ -189,13 +246,12 @@ def extract_video_metadata(file_path: str | Path) -> VideoMeta:
         VideoMeta with extracted metadata, or empty VideoMeta with minimal data
         if ffprobe is not available or fails.
     """
-    path = Path(file_path)
-
     if not FFPROBE_AVAILABLE:
         # Fallback: return empty VideoMeta (size and extension handled by MediaFile)
         return VideoMeta()
 
     # Run ffprobe and parse the output
+    path = file_path if isinstance(file_path, Path) else Path(file_path)
     ffprobe_output = _run_ffprobe(path)
     if ffprobe_output is None:
         # ffprobe failed for this file, return empty metadata
@@ -204,6 +260,33 @@ def extract_video_metadata(file_path: str | Path) -> VideoMeta:
     return parse_ffprobe_json(ffprobe_output)
 
 
+def extract_video_metadata_batch(
+    file_paths: list[str | Path], max_workers: int | None = None
+) -> list[VideoMeta]:
+    """Extract video metadata for many files, running ffprobe in parallel.
+
+    Each ffprobe call spends most of its time in a child process, so a
+    thread pool keeps several of them in flight at once.
+
+    Args:
+        file_paths: Paths to the video files.
+        max_workers: Maximum concurrent ffprobe processes. Defaults to twice
+            the CPU count.
+
+    Returns:
+        VideoMeta for each path, in the same order as file_paths.
+    """
+    if not FFPROBE_AVAILABLE or len(file_paths) < 2:
+        return [extract_video_metadata(path) for path in file_paths]
+
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) * 2
+    workers = max(1, min(max_workers, len(file_paths)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(extract_video_metadata, file_paths))
+
+
 def meets_minimum_duration(video_meta: VideoMeta | None, min_duration_sec: float) -> bool:
     """Check if video meets minimum duration requirement.
 
@@ -227,3 +310,28 @@ def meets_minimum_duration(video_meta: VideoMeta | None, min_duration_sec: float
         return True
 
     return video_meta.duration_sec >= min_duration_sec
+
+
+def filter_min_duration(
+    metas: list[VideoMeta | None], min_duration_sec: float
+) -> list[VideoMeta | None]:
+    """Filter a batch of video metadata by minimum duration.
+
+    Equivalent to keeping each item for which meets_minimum_duration() is True,
+    but without a function call per item.
+
+    Args:
+        metas: Video metadata entries, entries may be None.
+        min_duration_sec: Minimum duration in seconds.
+
+    Returns:
+        The entries that meet the minimum duration, in their original order.
+    """
+    if min_duration_sec <= 0:
+        return list(metas)
+
+    return [
+        m
+        for m in metas
+        if m is None or m.duration_sec is None or m.duration_sec >= min_duration_sec
+    ]
@@ -7,9 +7,36 @@ import os
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 from uuid import uuid4
 
+# Use orjson for faster (de)serialization when installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data to indented JSON.
+
+    Equivalent to json.dumps(data, ensure_ascii=False, indent=2).
+
+    Args:
+        data: JSON-compatible data.
+
+    Returns:
+        JSON string.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 
 class OrganizationMode(Enum):
     """Organization modes for file copying."""
@@ -48,7 +75,30 @@ class ValidationError(Exception):
     pass
 
 
-@dataclass
+_E = TypeVar("_E", bound=Enum)
+
+
+def _enum_from_value(enum_cls: type[_E], value: Any) -> _E:
+    """Look up an enum member by value.
+
+    Reads the enum's value-to-member map directly, which skips the EnumMeta
+    __call__ machinery; unknown values still go through enum_cls(value) so
+    they raise the usual ValueError.
+
+    Args:
+        enum_cls: Enum class to look up.
+        value: Serialized member value.
+
+    Returns:
+        The matching enum member.
+    """
+    try:
+        return enum_cls._value2member_map_[value]  # type: ignore[return-value]
+    except (KeyError, TypeError):
+        return enum_cls(value)
+
+
+@dataclass(slots=True)
 class RequestedItem:
     """Represents an item requested for copying."""
 
@@ -77,13 +127,13 @@ class RequestedItem:
     def from_dict(cls, data: dict[str, Any]) -> RequestedItem:
         """Deserialize from dictionary."""
         return cls(
-            tipo=RequestedItemType(data["tipo"]),
+            tipo=_enum_from_value(RequestedItemType, data["tipo"]),
             texto_original=data["texto_original"],
             texto_normalizado=data.get("texto_normalizado", ""),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CopyRules:
     """Rules that govern file copying behavior."""
 
@@ -186,7 +236,7 @@ class CopyRules:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CopyStats:
     """Statistics for a copy job."""
 
@@ -218,7 +268,7 @@ class CopyStats:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CopyJob:
     """Represents a copy job in the queue."""
 
@@ -276,21 +326,23 @@ class CopyJob:
             nombre=data["nombre"],
             origenes=data["origenes"],
             destino=data["destino"],
-            modo_organizacion=OrganizationMode(data.get("modo_organizacion", "single_folder")),
+            modo_organizacion=_enum_from_value(
+                OrganizationMode, data.get("modo_organizacion", "single_folder")
+            ),
             lista_items=[RequestedItem.from_dict(item) for item in data.get("lista_items", [])],
             reglas=CopyRules.from_dict(data.get("reglas", {})),
-            estado=CopyJobStatus(data.get("estado", "pending")),
+            estado=_enum_from_value(CopyJobStatus, data.get("estado", "pending")),
             stats=CopyStats.from_dict(data.get("stats", {})),
         )
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        return _dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> CopyJob:
         """Deserialize from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_loads(json_str))
 
 
 def export_queue_to_json(jobs: list[CopyJob]) -> str:
@@ -302,7 +354,7 @@ def export_queue_to_json(jobs: list[CopyJob]) -> str:
     Returns:
         JSON string representation of the queue.
     """
-    return json.dumps([job.to_dict() for job in jobs], ensure_ascii=False, indent=2)
+    return _dumps([job.to_dict() for job in jobs])
 
 
 def import_queue_from_json(json_str: str) -> list[CopyJob]:
@@ -314,11 +366,11 @@ def import_queue_from_json(json_str: str) -> list[CopyJob]:
     Returns:
         List of CopyJob instances.
     """
-    data = json.loads(json_str)
+    data = _loads(json_str)
     return [CopyJob.from_dict(job_data) for job_data in data]
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     """A saved profile containing rules and organization mode."""
 
@@ -350,19 +402,19 @@ class Profile:
         return cls(
             nombre=data["nombre"],
             reglas=CopyRules.from_dict(data.get("reglas", {})),
-            modo_organizacion=OrganizationMode(
-                data.get("modo_organizacion", "single_folder")
+            modo_organizacion=_enum_from_value(
+                OrganizationMode, data.get("modo_organizacion", "single_folder")
             ),
         )
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        return _dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> "Profile":
         """Deserialize from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_loads(json_str))
 
 
 class ProfileManager:
@@ -380,6 +432,8 @@ class ProfileManager:
             # Default to a directory in user's home
             self._profiles_dir = Path.home() / ".mediacopier" / "profiles"
         self._profiles_dir.mkdir(parents=True, exist_ok=True)
+        # File name -> ((mtime_ns, size), profile name or None if unreadable)
+        self._name_cache: dict[str, tuple[tuple[int, int], str | None]] = {}
 
     def _get_profile_path(self, name: str) -> Path:
         """Get the file path for a profile name."""
@@ -403,8 +457,30 @@ class ProfileManager:
             ValidationError: If the profile is invalid.
         """
         profile.validate()
+        return self._write_profile(profile)
+
+    def save_profiles(self, profiles: list[Profile]) -> list[Path]:
+        """Save several profiles, validating all of them before writing any.
+
+        Args:
+            profiles: Profiles to save.
+
+        Returns:
+            Paths where the profiles were saved, in the same order.
+
+        Raises:
+            ValidationError: If any profile is invalid; nothing is written.
+        """
+        for profile in profiles:
+            profile.validate()
+        return [self._write_profile(profile) for profile in profiles]
+
+    def _write_profile(self, profile: Profile) -> Path:
+        """Write an already validated profile and record its name in the cache."""
         file_path = self._get_profile_path(profile.nombre)
         file_path.write_text(profile.to_json(), encoding="utf-8")
+        stat = file_path.stat()
+        self._name_cache[file_path.name] = ((stat.st_mtime_ns, stat.st_size), profile.nombre)
         return file_path
 
     def load_profile(self, name: str) -> Profile | None:
@@ -428,20 +504,41 @@ class ProfileManager:
     def list_profiles(self) -> list[str]:
         """List all available profile names.
 
+        Profile files are only parsed when they are new or have changed on
+        disk since the last listing.
+
         Returns:
             List of profile names.
         """
         profiles = []
-        for file_path in self._profiles_dir.glob("*.json"):
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                profile = Profile.from_json(content)
-                profiles.append(profile.nombre)
-            except (json.JSONDecodeError, KeyError, ValueError):
-                # Skip invalid profile files
-                continue
+        name_cache: dict[str, tuple[tuple[int, int], str | None]] = {}
+        with os.scandir(self._profiles_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                key = (stat.st_mtime_ns, stat.st_size)
+                cached = self._name_cache.get(entry.name)
+                if cached is not None and cached[0] == key:
+                    name = cached[1]
+                else:
+                    name = self._read_profile_name(Path(entry.path))
+                name_cache[entry.name] = (key, name)
+                if name is not None:
+                    profiles.append(name)
+        self._name_cache = name_cache
         return sorted(profiles)
 
+    @staticmethod
+    def _read_profile_name(file_path: Path) -> str | None:
+        """Read the profile name from a profile file, or None if it is invalid."""
+        try:
+            content = file_path.read_text(encoding="utf-8")
+            return Profile.from_json(content).nombre
+        except (json.JSONDecodeError, KeyError, ValueError):
+            # Skip invalid profile files
+            return None
+
     def delete_profile(self, name: str) -> bool:
         """Delete a profile by name.
 
@@ -454,5 +551,6 @@ class ProfileManager:
         file_path = self._get_profile_path(name)
         if file_path.exists():
             file_path.unlink()
+            self._name_cache.pop(file_path.name, None)
             return True
         return False
@@ -0,0 +1,197 @@
+"""Text keys shared by the indexer and the matcher.
+
+Catalog files and requested items are compared through the normalized
+forms built here, so this module must not import other mediacopier modules.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# Memoization size for the text helpers; large enough to hold the names of
+# a big library so reloading a catalog does not redo the regex work
+_TEXT_CACHE_SIZE = 65536
+
+
+# Patterns to remove from song names for normalization
+# Uses word boundary and captures everything until end of string or parenthesis/bracket
+FEAT_PATTERNS = re.compile(
+    r"\b(?:feat\.?|ft\.?|featuring)\b[\s.]*[^()[\]]*?(?=\s*[\(\[]|$)",
+    re.IGNORECASE,
+)
+
+# Parenthetical content patterns (for cleanup but also for analysis)
+PARENTHETICAL_PATTERN = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+
+# Cleanup patterns applied by normalize_text, compiled once at import time
+HYPHEN_PATTERN = re.compile(r"[-–—_]+")
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+
+class _CombiningMarksTable(dict):
+    """str.translate table that deletes Unicode combining marks.
+
+    Entries are filled on first lookup, so translate runs at C speed for
+    every code point seen before without building a table for all of Unicode.
+    """
+
+    def __missing__(self, code: int) -> int | None:
+        value = None if unicodedata.combining(chr(code)) else code
+        self[code] = value
+        return value
+
+
+_COMBINING_MARKS = _CombiningMarksTable()
+
+# ASCII equivalent of HYPHEN_PATTERN + PUNCTUATION_PATTERN for str.translate:
+# hyphens/underscores become spaces, other non-word, non-space chars are dropped
+_ASCII_CLEANUP_TABLE = {
+    code: (" " if chr(code) in "-_" else None)
+    for code in range(128)
+    if chr(code) in "-_" or PUNCTUATION_PATTERN.match(chr(code))
+}
+
+# Words that indicate lower-quality versions for songs
+PENALTY_WORDS = frozenset(
+    {
+        "live",
+        "cover",
+        "karaoke",
+        "instrumental",
+        "acoustic",
+        "demo",
+        "remix",
+        "bootleg",
+        "tribute",
+    }
+)
+
+# Words that indicate quality/official versions (bonus scoring)
+BONUS_WORDS = frozenset(
+    {
+        "official",
+        "remastered",
+        "remaster",
+        "deluxe",
+        "hd",
+        "hq",
+        "original",
+    }
+)
+
+# Runs of word characters; PENALTY_WORDS/BONUS_WORDS entries are whole runs,
+# so a set intersection gives the same result as word-boundary matching
+WORD_PATTERN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def normalize_text(text: str) -> str:
+    """Apply strong normalization for matching.
+
+    Steps:
+    1. Convert to lowercase (case folding)
+    2. Normalize unicode characters (accents, etc.)
+    3. Remove feat/ft/featuring patterns
+    4. Remove punctuation
+    5. Collapse multiple spaces
+    6. Normalize hyphens/dashes to spaces
+    7. Strip leading/trailing whitespace
+
+    Results are memoized since the same catalog names are normalized
+    repeatedly across matching calls.
+
+    Args:
+        text: Original text to normalize.
+
+    Returns:
+        Normalized text for comparison.
+    """
+    # Convert to lowercase (full Unicode case folding, e.g. "ß" -> "ss")
+    result = text.casefold()
+
+    # Normalize unicode characters (remove accents); pure ASCII has none to strip
+    if not result.isascii():
+        result = unicodedata.normalize("NFKD", result).translate(_COMBINING_MARKS)
+
+    # Remove feat/ft/featuring patterns
+    result = FEAT_PATTERNS.sub("", result)
+
+    # Remove parenthetical content for base comparison
+    result = PARENTHETICAL_PATTERN.sub("", result)
+
+    if result.isascii():
+        # Hyphens to spaces and punctuation removal in one table lookup
+        result = result.translate(_ASCII_CLEANUP_TABLE)
+    else:
+        # Normalize hyphens and dashes to spaces
+        result = HYPHEN_PATTERN.sub(" ", result)
+
+        # Remove punctuation (keep alphanumeric and spaces)
+        result = PUNCTUATION_PATTERN.sub("", result)
+
+    # Collapse multiple spaces and strip in a single pass
+    return " ".join(result.split())
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def extract_base_name(text: str) -> str:
+    """Extract the base name from a text, removing version suffixes.
+
+    This is used to compare base song/item names without extras like
+    "(Remastered 2011)" or "[Official Audio]".
+
+    Args:
+        text: Original text.
+
+    Returns:
+        Base name without version suffixes.
+    """
+    # Remove parenthetical and bracket content
+    result = PARENTHETICAL_PATTERN.sub("", text)
+    # Remove feat patterns
+    result = FEAT_PATTERNS.sub("", result)
+    # Normalize
+    return normalize_text(result)
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def tokenize(text: str) -> frozenset[str]:
+    """Split normalized text into a set of tokens.
+
+    The result is immutable so it can be safely shared between cached calls.
+
+    Args:
+        text: Normalized text.
+
+    Returns:
+        Frozen set of word tokens.
+    """
+    normalized = normalize_text(text)
+    return frozenset(normalized.split())
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def classify_tokens(text: str) -> tuple[frozenset[str], frozenset[str]]:
+    """Find the penalty and bonus words of a text in a single pass.
+
+    Words are taken from the lowercased raw text, so parenthetical content
+    such as "(Live)" is included.
+
+    Args:
+        text: Text to analyze.
+
+    Returns:
+        Tuple of (penalty_words, bonus_words) found in text.
+    """
+    words = frozenset(WORD_PATTERN.findall(text.lower()))
+    return words & PENALTY_WORDS, words & BONUS_WORDS
+
+
+def clear_normalize_cache() -> None:
+    """Clear the memoized results of the text normalization helpers."""
+    normalize_text.cache_clear()
+    extract_base_name.cache_clear()
+    tokenize.cache_clear()
+    classify_tokens.cache_clear()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import replace
 from pathlib import Path
 
 from mediacopier.core.indexer import (
@@ -116,6 +117,42 @@ class TestMediaFile:
         assert media_file.tamano == 1600
         assert media_file.tipo == MediaType.AUDIO
 
+    def test_matching_keys(self) -> None:
+        """Test precomputed matching keys derived from nombre_base."""
+        media_file = MediaFile(
+            path="/music/Song Name (Live) [Official].mp3",
+            nombre_base="Song Name (Live) [Official]",
+            extension=".mp3",
+            tamano=1024,
+            tipo=MediaType.AUDIO,
+        )
+
+        assert media_file.normalized_name == "song name"
+        assert media_file.base_name == "song name"
+        assert media_file.tokens == {"song", "name"}
+        assert media_file.penalties == {"live"}
+        assert media_file.bonuses == {"official"}
+        # Cached keys don't affect equality or serialization
+        assert media_file == MediaFile.from_dict(media_file.to_dict())
+
+    def test_replace_derives_keys_from_new_name(self) -> None:
+        """Test a renamed copy does not inherit the original's cached keys."""
+        media_file = MediaFile(
+            path="/music/Song Name (Live).mp3",
+            nombre_base="Song Name (Live)",
+            extension=".mp3",
+            tamano=1024,
+            tipo=MediaType.AUDIO,
+        )
+        assert media_file.penalties == {"live"}
+
+        renamed = replace(media_file, nombre_base="Other Song - Official")
+
+        assert renamed.normalized_name == "other song official"
+        assert renamed.tokens == {"other", "song", "official"}
+        assert renamed.penalties == frozenset()
+        assert renamed.bonuses == {"official"}
+
 
 class TestMediaCatalog:
     """Tests for MediaCatalog dataclass."""
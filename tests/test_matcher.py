@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from mediacopier.core.indexer import MediaCatalog, MediaFile, MediaType
@@ -9,19 +11,29 @@ from mediacopier.core.matcher import (
     RAPIDFUZZ_AVAILABLE,
     MatchCandidate,
     MatchResult,
+    _calculate_score,
+    _extension_sets,
+    _prepare_eligible,
+    classify_tokens,
+    contains_exclusion_word,
     explain_match,
     extract_base_name,
+    extract_resolution_from_name,
     fuzzy_ratio,
     get_bonus_words_in_text,
     get_penalty_words_in_text,
+    get_resolution_score,
     match_items,
     match_single_item,
     normalize_text,
+    similarity_scores,
     token_set_ratio,
     token_sort_ratio,
     tokenize,
 )
-from mediacopier.core.models import RequestedItem, RequestedItemType
+from mediacopier.core.metadata_video import VideoMeta
+from mediacopier.core.models import CopyRules, RequestedItem, RequestedItemType
+from mediacopier.core.text_keys import clear_normalize_cache
 
 
 class TestNormalizeText:
@@ -48,6 +60,12 @@ class TestNormalizeText:
         assert normalize_text("song—title") == "song title"
         assert normalize_text("under_score") == "under score"
 
+    def test_punctuation_ascii_and_unicode_paths(self) -> None:
+        """Test ASCII and non-ASCII names are cleaned the same way."""
+        assert normalize_text("Rock-n-Roll, Baby!") == "rock n roll baby"
+        assert normalize_text("Rock–n–Roll, Bébé! ¿Sí?") == "rock n roll bebe si"
+        assert normalize_text("a.-b") == normalize_text("a.–b") == "a b"
+
     def test_remove_feat_patterns(self) -> None:
         """Test that feat/ft/featuring patterns are removed."""
         assert normalize_text("Song feat. Artist") == "song"
@@ -75,6 +93,11 @@ class TestNormalizeText:
         assert normalize_text("naïve") == "naive"
         assert normalize_text("résumé") == "resume"
 
+    def test_unicode_case_folding(self) -> None:
+        """Test full case folding and removal of marks outside the accent block."""
+        assert normalize_text("STRASSE") == normalize_text("Straße") == "strasse"
+        assert normalize_text("a\u20d0b Ça") == "ab ca"
+
 
 class TestExtractBaseName:
     """Tests for extract_base_name function."""
@@ -108,7 +131,9 @@ class TestTokenize:
     def test_basic_tokenization(self) -> None:
         """Test basic word tokenization."""
         tokens = tokenize("hello world")
-        assert tokens == {"hello", "world"}
+        assert tokens == frozenset({"hello", "world"})
+        # Immutable so cached results can be shared safely
+        assert isinstance(tokens, frozenset)
 
     def test_tokenize_with_punctuation(self) -> None:
         """Test tokenization removes punctuation."""
@@ -120,6 +145,16 @@ class TestTokenize:
         tokens = tokenize("Song Name (Official)")
         assert tokens == {"song", "name"}
 
+    def test_clear_normalize_cache(self) -> None:
+        """Test the text helper caches can be cleared."""
+        tokenize("Cached Song (Live)")
+        extract_base_name("Cached Song (Live)")
+        clear_normalize_cache()
+
+        for func in (normalize_text, extract_base_name, tokenize):
+            assert func.cache_info().currsize == 0
+        assert extract_base_name("Cached Song (Live)") == "cached song"
+
 
 class TestPenaltyAndBonusWords:
     """Tests for penalty and bonus word detection."""
@@ -162,6 +197,13 @@ class TestPenaltyAndBonusWords:
         # But 'HD' as standalone should match
         assert "hd" in get_bonus_words_in_text("Song (HD Quality)")
 
+    def test_classify_tokens(self) -> None:
+        """Test penalty and bonus words are found together from the raw text."""
+        penalties, bonuses = classify_tokens("Song (Live) - Remastered [Official]")
+        assert penalties == frozenset({"live"})
+        assert bonuses == frozenset({"remastered", "official"})
+        assert classify_tokens("Delivery Unofficial") == (frozenset(), frozenset())
+
 
 class TestFuzzyRatios:
     """Tests for fuzzy matching functions."""
@@ -192,6 +234,30 @@ class TestFuzzyRatios:
         score = token_set_ratio("hello world test", "hello world")
         assert score > 50
 
+    def test_score_cutoff(self) -> None:
+        """Test that scores below score_cutoff are reported as zero."""
+        assert fuzzy_ratio("hello", "world", score_cutoff=90.0) == 0.0
+        assert token_sort_ratio("hello world", "planet mars", score_cutoff=90.0) == 0.0
+        assert token_set_ratio("a b c", "a d e", score_cutoff=90.0) == 0.0
+        # Scores at or above the cutoff are unaffected
+        assert fuzzy_ratio("hello", "hello", score_cutoff=90.0) == 100.0
+        assert fuzzy_ratio("hello", "hallo", score_cutoff=50.0) == fuzzy_ratio("hello", "hallo")
+
+    def test_similarity_scores_batch(self) -> None:
+        """Test batch scoring matches the best of the individual scorers."""
+        choices = ["hello world", "world hello", "hallo", "something else"]
+        scores = similarity_scores("hello world", choices)
+
+        assert len(scores) == len(choices)
+        for choice, score in zip(choices, scores):
+            expected = max(
+                fuzzy_ratio("hello world", choice),
+                token_sort_ratio("hello world", choice),
+                token_set_ratio("hello world", choice),
+            )
+            assert score == pytest.approx(expected)
+        assert similarity_scores("hello", []) == []
+
 
 class TestMatchCandidate:
     """Tests for MatchCandidate dataclass."""
@@ -235,6 +301,16 @@ class TestMatchResult:
         assert data["best_match"] is None
         assert data["candidates"] == []
 
+    def test_slotted(self) -> None:
+        """Test match results carry no per-instance __dict__."""
+        item = RequestedItem(tipo=RequestedItemType.SONG, texto_original="Test Song")
+        result = MatchResult(requested_item=item)
+
+        assert not hasattr(result, "__dict__")
+        assert "reason" in MatchCandidate.__slots__
+        with pytest.raises(AttributeError):
+            result.extra = True  # type: ignore[attr-defined]
+
 
 class TestMatchSingleItem:
     """Tests for match_single_item function."""
@@ -317,57 +393,104 @@ class TestMatchSingleItem:
 
         assert result.match_found is False
 
+    def test_unreachable_candidates_not_scored(self, sample_catalog: MediaCatalog) -> None:
+        """Test files that cannot reach the threshold skip the full scoring."""
+        item = RequestedItem(tipo=RequestedItemType.SONG, texto_original="Song Name")
+        with patch(
+            "mediacopier.core.matcher._calculate_score", wraps=_calculate_score
+        ) as calculate:
+            result = match_single_item(item, sample_catalog, threshold=90.0)
+
+        assert result.match_found is True
+        scored = {call.args[1].nombre_base for call in calculate.call_args_list}
+        assert "Different Song" not in scored
+
+    def test_threshold_threaded_as_score_cutoff(self) -> None:
+        """Test the cutoff keeps candidates that reach the threshold only via bonuses."""
+        catalog = MediaCatalog(
+            archivos=[
+                MediaFile(
+                    path=f"/music/{name}.mp3",
+                    nombre_base=name,
+                    extension=".mp3",
+                    tamano=5000000,
+                    tipo=MediaType.AUDIO,
+                )
+                for name in ("Song Nam HD", "Completely Unrelated Track")
+            ]
+        )
+        item = RequestedItem(tipo=RequestedItemType.SONG, texto_original="Song Name")
+        with patch("mediacopier.core.matcher.similarity_scores", wraps=similarity_scores) as scores:
+            result = match_single_item(item, catalog, threshold=90.0)
+
+        # Threshold minus the largest possible token, bonus-word and exact extras
+        assert scores.call_args.kwargs["score_cutoff"] == 90.0 - (15.0 + 5.0 * 1)
+        assert [c.media_file.nombre_base for c in result.candidates] == ["Song Nam HD"]
+        assert similarity_scores("song name", ["song nam hd"])[0] < 90.0
+
+    def test_duplicate_names_scored_once(self) -> None:
+        """Test files sharing a normalized name are fuzzy-scored once."""
+        catalog = MediaCatalog(
+            archivos=[
+                MediaFile(
+                    path=f"/music/{folder}/Song Name{ext}",
+                    nombre_base="Song Name",
+                    extension=ext,
+                    tamano=5000000,
+                    tipo=MediaType.AUDIO,
+                )
+                for folder, ext in (("a", ".mp3"), ("b", ".flac"), ("c", ".mp3"))
+            ]
+        )
+        item = RequestedItem(tipo=RequestedItemType.SONG, texto_original="Song Nam")
+        with patch("mediacopier.core.matcher.similarity_scores", wraps=similarity_scores) as scores:
+            result = match_single_item(item, catalog)
+
+        assert scores.call_args.kwargs["choices"] == ["song name"]
+        assert len(result.candidates) == 3
+        assert len({c.score for c in result.candidates}) == 1
+
+    def test_reasons_built_only_for_returned_candidates(self, sample_catalog: MediaCatalog) -> None:
+        """Test the reason text is only built for candidates that are returned."""
+        item = RequestedItem(tipo=RequestedItemType.SONG, texto_original="Song Name")
+        full = match_single_item(item, sample_catalog)
+        with patch(
+            "mediacopier.core.matcher._calculate_score", wraps=_calculate_score
+        ) as calculate:
+            result = match_single_item(item, sample_catalog, max_candidates=1)
+
+        explained = [c for c in calculate.call_args_list if c.kwargs["explain"]]
+        assert len(explained) == 1
+        assert result.best_match is not None
+        assert result.best_match.reason == full.candidates[0].reason
+        assert result.best_match.score == full.candidates[0].score
+
     def test_penalty_words_reduce_score(self, sample_catalog: MediaCatalog) -> None:
         """Test that penalty words (live, karaoke) reduce scores for songs."""
         item = RequestedItem(tipo=RequestedItemType.SONG, texto_original="Song Name")
         result = match_single_item(item, sample_catalog)
 
-        # Find the live and karaoke versions in candidates
-        live_candidate = None
-        karaoke_candidate = None
-        official_candidate = None
-
-        for candidate in result.candidates:
-            if "Live" in candidate.media_file.nombre_base:
-                live_candidate = candidate
-            elif "Karaoke" in candidate.media_file.nombre_base:
-                karaoke_candidate = candidate
-            elif "Official" in candidate.media_file.nombre_base:
-                official_candidate = candidate
-
-        # Live and Karaoke should have penalties
-        if live_candidate:
-            assert "live" in live_candidate.penalties
-        if karaoke_candidate:
-            assert "karaoke" in karaoke_candidate.penalties
-
-        # Official should have bonus
-        if official_candidate:
-            assert "official" in official_candidate.bonuses
+        # Live and Karaoke should have penalties, Official should have bonus
+        penalties = {tag for c in result.candidates for tag in c.penalties}
+        bonuses = {tag for c in result.candidates for tag in c.bonuses}
+        assert {"live", "karaoke"} <= penalties
+        assert "official" in bonuses
 
     def test_ranking_prefers_official_over_live(self, sample_catalog: MediaCatalog) -> None:
         """Test that official/remastered versions rank higher than live/karaoke."""
         item = RequestedItem(tipo=RequestedItemType.SONG, texto_original="Song Name")
         result = match_single_item(item, sample_catalog)
 
-        # Get positions of different versions
-        positions: dict[str, int] = {}
-        for i, candidate in enumerate(result.candidates):
-            name = candidate.media_file.nombre_base
-            if "Official" in name:
-                positions["official"] = i
-            elif "Remastered" in name:
-                positions["remastered"] = i
-            elif "Live" in name:
-                positions["live"] = i
-            elif "Karaoke" in name:
-                positions["karaoke"] = i
+        # Get positions of different versions by their bonus/penalty tags
+        by_tag = {
+            tag: i
+            for i, candidate in enumerate(result.candidates)
+            for tag in (*candidate.bonuses, *candidate.penalties)
+        }
 
         # Official and Remastered should rank before Live and Karaoke
-        if "official" in positions and "live" in positions:
-            assert positions["official"] < positions["live"]
-        if "remastered" in positions and "karaoke" in positions:
-            assert positions["remastered"] < positions["karaoke"]
+        assert by_tag["official"] < by_tag["live"]
+        assert by_tag["remastered"] < by_tag["karaoke"]
 
 
 class TestMatchItems:
@@ -416,6 +539,27 @@ class TestMatchItems:
         assert results[0].match_found is True
         assert results[1].match_found is True
 
+    @pytest.mark.parametrize(
+        "texts",
+        [
+            ["Song A", "Song A"],
+            ["Song A", "song a!", "Song B", "Song A"],
+        ],
+    )
+    def test_match_duplicate_items(self, sample_catalog: MediaCatalog, texts: list[str]) -> None:
+        """Test that duplicated requests get the same result at every position."""
+        items = [RequestedItem(tipo=RequestedItemType.SONG, texto_original=t) for t in texts]
+        results = match_items(items, sample_catalog, threshold=50.0)
+
+        assert len(results) == len(items)
+        for item, result in zip(items, results):
+            assert result.requested_item is item
+            expected = match_items([item], sample_catalog, threshold=50.0)[0]
+            assert [c.media_file.path for c in result.candidates] == [
+                c.media_file.path for c in expected.candidates
+            ]
+            assert [c.score for c in result.candidates] == [c.score for c in expected.candidates]
+
     def test_match_items_with_threshold(self, sample_catalog: MediaCatalog) -> None:
         """Test that threshold is applied correctly."""
         items = [
@@ -426,6 +570,23 @@ class TestMatchItems:
         assert len(results) == 1
         assert results[0].match_found is False
 
+    def test_match_items_filters_catalog_once(self, sample_catalog: MediaCatalog) -> None:
+        """Test the rule filtering runs once per batch and matches per-item results."""
+        rules = CopyRules(extensiones_audio_permitidas=["mp3"])
+        items = [
+            RequestedItem(tipo=RequestedItemType.SONG, texto_original=t)
+            for t in ("Song A", "Song B", "Song C")
+        ]
+        with patch(
+            "mediacopier.core.matcher._prepare_eligible", wraps=_prepare_eligible
+        ) as prepare:
+            results = match_items(items, sample_catalog, rules=rules, threshold=50.0)
+
+        assert prepare.call_count == 1
+        for item, result in zip(items, results):
+            single = match_single_item(item, sample_catalog, threshold=50.0, rules=rules)
+            assert [c.score for c in result.candidates] == [c.score for c in single.candidates]
+
 
 class TestAcceptanceCriteria:
     """Tests for the specific acceptance criteria in the issue."""
@@ -532,7 +693,7 @@ class TestExplainMatch:
 
 
 class TestRapidfuzzFallback:
-    """Tests to ensure difflib fallback works when rapidfuzz is not available."""
+    """Tests to ensure the pure-Python fallback works when rapidfuzz is not available."""
 
     def test_fuzzy_functions_work(self) -> None:
         """Test that fuzzy functions work regardless of rapidfuzz availability."""
@@ -545,6 +706,31 @@ class TestRapidfuzzFallback:
         assert 0 <= score2 <= 100
         assert 0 <= score3 <= 100
 
+    def test_fallback_ratio_uses_indel_distance(self) -> None:
+        """Test the pure-Python ratio normalizes the indel distance like rapidfuzz."""
+        with patch("mediacopier.core.matcher.RAPIDFUZZ_AVAILABLE", False):
+            assert fuzzy_ratio("hello", "hallo") == 80.0
+            assert fuzzy_ratio("", "") == 100.0
+            assert fuzzy_ratio("abc", "") == 0.0
+            assert token_sort_ratio("hello world", "world hello") == 100.0
+            assert fuzzy_ratio("hello", "hallo", score_cutoff=90.0) == 0.0
+            # Strings longer than a machine word use the same big-int bit vector
+            assert fuzzy_ratio("a" * 100, "a" * 100) == 100.0
+            assert fuzzy_ratio("ab" * 50, "b" * 100) == 50.0
+
+    def test_fallback_similarity_length_pruning(self) -> None:
+        """Test the fallback skips character scorers on far-off lengths only."""
+        with patch("mediacopier.core.matcher.RAPIDFUZZ_AVAILABLE", False):
+            scores = similarity_scores(
+                "song name",
+                ["song nam", "song name extended live version mix", "other"],
+                score_cutoff=30.0,
+            )
+            assert scores[0] == fuzzy_ratio("song name", "song nam")
+            # Outside the length window, but the token set still matches
+            assert scores[1] > 0
+            assert scores[2] == 0.0
+
     def test_rapidfuzz_availability_flag(self) -> None:
         """Test that RAPIDFUZZ_AVAILABLE flag is a boolean."""
         assert isinstance(RAPIDFUZZ_AVAILABLE, bool)
@@ -555,8 +741,6 @@ class TestExclusionWords:
 
     def test_contains_exclusion_word_single_word(self) -> None:
         """Test detection of single exclusion words."""
-        from mediacopier.core.matcher import contains_exclusion_word
-
         # Should detect 'sample'
         result, word = contains_exclusion_word("Movie Sample 2023", ["sample"])
         assert result is True
@@ -569,8 +753,6 @@ class TestExclusionWords:
 
     def test_contains_exclusion_word_phrase(self) -> None:
         """Test detection of multi-word phrases."""
-        from mediacopier.core.matcher import contains_exclusion_word
-
         # Should detect 'low quality'
         result, word = contains_exclusion_word("Movie low quality version", ["low quality"])
         assert result is True
@@ -578,8 +760,6 @@ class TestExclusionWords:
 
     def test_contains_exclusion_word_no_partial_match(self) -> None:
         """Test that partial words don't match."""
-        from mediacopier.core.matcher import contains_exclusion_word
-
         # 'camrip' should not match 'camera'
         result, _ = contains_exclusion_word("Camera Footage", ["camrip"])
         assert result is False
@@ -590,8 +770,6 @@ class TestExclusionWords:
 
     def test_contains_exclusion_word_case_insensitive(self) -> None:
         """Test case-insensitive matching."""
-        from mediacopier.core.matcher import contains_exclusion_word
-
         result, word = contains_exclusion_word("MOVIE SAMPLE 2023", ["sample"])
         assert result is True
 
@@ -600,16 +778,20 @@ class TestExclusionWords:
 
     def test_contains_exclusion_word_empty_list(self) -> None:
         """Test with empty exclusion list."""
-        from mediacopier.core.matcher import contains_exclusion_word
-
         result, word = contains_exclusion_word("Any Movie Name", [])
         assert result is False
         assert word is None
 
+    def test_contains_exclusion_word_list_order(self) -> None:
+        """Test the first listed word is reported when several match."""
+        words = ["  ", "Trailer", "sample"]
+        result, word = contains_exclusion_word("Sample - Movie Trailer", words)
+        assert result is True
+        assert word == "Trailer"
+        assert contains_exclusion_word("Movie", ["", " "]) == (False, None)
+
     def test_exclusion_filters_in_match(self) -> None:
         """Test that exclusion words filter out files during matching."""
-        from mediacopier.core.models import CopyRules
-
         # Create catalog with some junk files
         catalog = MediaCatalog(
             archivos=[
@@ -655,8 +837,6 @@ class TestResolutionScoring:
 
     def test_extract_resolution_from_name(self) -> None:
         """Test resolution extraction from filenames."""
-        from mediacopier.core.matcher import extract_resolution_from_name
-
         assert extract_resolution_from_name("Movie Name 1080p.mkv") == "1080p"
         assert extract_resolution_from_name("Movie Name 720p BluRay") == "720p"
         assert extract_resolution_from_name("Movie 4K HDR") == "4k"
@@ -665,8 +845,6 @@ class TestResolutionScoring:
 
     def test_get_resolution_score(self) -> None:
         """Test resolution scoring."""
-        from mediacopier.core.matcher import get_resolution_score
-
         # Test from filename resolution
         assert get_resolution_score("1080p", None, None) == 80
         assert get_resolution_score("720p", None, None) == 60
@@ -683,9 +861,6 @@ class TestResolutionScoring:
 
     def test_higher_resolution_preferred(self) -> None:
         """Test that resolution adds bonus to score for movies."""
-        from mediacopier.core.models import CopyRules
-        from mediacopier.core.metadata_video import VideoMeta
-
         # Create catalog with identical names but different resolutions (via metadata)
         catalog = MediaCatalog(
             archivos=[
@@ -744,8 +919,6 @@ class TestBestMatchSelection:
 
     def test_solo_mejor_match_returns_one_candidate(self) -> None:
         """Test that solo_mejor_match returns only the best match."""
-        from mediacopier.core.models import CopyRules
-
         # Create catalog with multiple similar files
         catalog = MediaCatalog(
             archivos=[
@@ -792,8 +965,6 @@ class TestExtensionFiltering:
 
     def test_audio_extension_whitelist(self) -> None:
         """Test audio extension whitelist filtering."""
-        from mediacopier.core.models import CopyRules
-
         catalog = MediaCatalog(
             archivos=[
                 MediaFile(
@@ -838,8 +1009,6 @@ class TestExtensionFiltering:
 
     def test_audio_extension_blacklist(self) -> None:
         """Test audio extension blacklist filtering."""
-        from mediacopier.core.models import CopyRules
-
         catalog = MediaCatalog(
             archivos=[
                 MediaFile(
@@ -876,8 +1045,6 @@ class TestExtensionFiltering:
 
     def test_video_extension_filtering(self) -> None:
         """Test video extension whitelist/blacklist filtering."""
-        from mediacopier.core.models import CopyRules
-
         catalog = MediaCatalog(
             archivos=[
                 MediaFile(
@@ -911,3 +1078,34 @@ class TestExtensionFiltering:
         extensions = [c.media_file.extension for c in result.candidates]
         assert ".mkv" in extensions
         assert ".avi" not in extensions
+
+    def test_extension_rules_case_and_dot_insensitive(self) -> None:
+        """Test extension rules ignore case and the leading dot."""
+        catalog = MediaCatalog(
+            archivos=[
+                MediaFile(
+                    path=f"/media/Song 1{ext}",
+                    nombre_base="Song 1",
+                    extension=ext,
+                    tamano=5000000,
+                    tipo=MediaType.AUDIO,
+                )
+                for ext in (".mp3", ".MP3", ".wma", ".flac")
+            ]
+        )
+        item = RequestedItem(tipo=RequestedItemType.SONG, texto_original="Song 1")
+        rules = CopyRules(
+            extensiones_audio_bloqueadas=["WMA"],
+            extensiones_audio_permitidas=["mp3", ".WMA"],
+            excluir_palabras=[],
+        )
+        result = match_single_item(item, catalog, rules=rules, threshold=50.0)
+
+        assert {c.media_file.extension for c in result.candidates} == {".mp3", ".MP3"}
+
+    def test_extension_sets(self) -> None:
+        """Test extension lists are normalized into lookup sets."""
+        blocked, allowed = _extension_sets([".WMA", "ogg"], ["MP3", ".flac"])
+        assert blocked == {".wma", "wma", "ogg", ".ogg"}
+        assert allowed == {".mp3", ".flac"}
+        assert _extension_sets([], []) == (frozenset(), None)
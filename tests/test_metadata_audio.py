@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from mediacopier.core import metadata_audio
 from mediacopier.core.metadata_audio import (
+    _UNKNOWN_PREFIX,
     MUTAGEN_AVAILABLE,
     UNKNOWN_ARTIST,
     UNKNOWN_GENRE,
     UNKNOWN_TITLE,
     AudioMeta,
+    _organization_prefix,
     extract_audio_metadata,
     get_organization_path_by_genre,
     parse_artist_title_from_filename,
@@ -72,6 +78,13 @@ class TestParseArtistTitleFromFilename:
         assert artist == "Artist Name"
         assert title == "Song - Part 2"
 
+    def test_separator_needs_text_on_both_sides(self) -> None:
+        """Test leading/trailing dashes are not used as the separator."""
+        assert parse_artist_title_from_filename("-Artist - Title") == ("-Artist", "Title")
+        assert parse_artist_title_from_filename("Artist —Title-") == ("Artist", "Title-")
+        assert parse_artist_title_from_filename("Song-") == (UNKNOWN_ARTIST, "Song-")
+        assert parse_artist_title_from_filename("AC–DC - Title") == ("AC", "DC - Title")
+
 
 class TestAudioMeta:
     """Tests for AudioMeta dataclass."""
@@ -183,6 +196,26 @@ class TestGetOrganizationPathByGenre:
         # The path should be sanitized
         assert "Rock_Metal/AC_DC/song.mp3" == path
 
+    def test_sanitizes_windows_invalid_chars(self) -> None:
+        """All Windows-invalid characters become underscores."""
+        meta = AudioMeta(artist='a<b>c:d"e\\f|g?h*i', genre=" .Rock. ")
+        path = get_organization_path_by_genre(meta, "song.mp3")
+        assert path == "Rock/a_b_c_d_e_f_g_h_i/song.mp3"
+
+    def test_unknown_prefix_is_sanitized(self) -> None:
+        """The precomputed no-metadata prefix matches the sanitized one."""
+        assert _UNKNOWN_PREFIX == _organization_prefix(UNKNOWN_GENRE, UNKNOWN_ARTIST)
+
+    def test_prefix_reused_across_tracks(self) -> None:
+        """Tracks sharing genre and artist reuse the cached prefix."""
+        _organization_prefix.cache_clear()
+        meta = AudioMeta(artist="AC/DC", genre="Rock")
+        first = get_organization_path_by_genre(meta, "a.mp3")
+        second = get_organization_path_by_genre(meta, "b.mp3")
+        assert first == "Rock/AC_DC/a.mp3"
+        assert second == "Rock/AC_DC/b.mp3"
+        assert _organization_prefix.cache_info().hits == 1
+
 
 class TestExtractAudioMetadata:
     """Tests for extract_audio_metadata function."""
@@ -278,6 +311,45 @@ class TestMockMutagenExtraction:
         assert meta.artist == UNKNOWN_ARTIST
         assert meta.title == "test_song"
 
+    @pytest.mark.skipif(not MUTAGEN_AVAILABLE, reason="mutagen not installed")
+    def test_dispatch_ignores_extension_case(self, tmp_path: Path) -> None:
+        """Test that an uppercase extension uses the matching extractor."""
+        test_file = tmp_path / "LOUD.MP3"
+        test_file.write_bytes(b"fake mp3 content")
+
+        mock_audio = MagicMock()
+        mock_audio.info.length = 10.0
+        mock_audio.info.bitrate = 128000
+        mock_audio.tags = {"artist": ["Band"], "title": ["Song"]}
+
+        with patch("mediacopier.core.metadata_audio.MP3", return_value=mock_audio) as mock_mp3:
+            meta = extract_audio_metadata(test_file)
+
+        mock_mp3.assert_called_once()
+        assert meta is not None
+        assert meta.artist == "Band"
+        assert meta.bitrate_kbps == 128
+
+    @pytest.mark.skipif(not MUTAGEN_AVAILABLE, reason="mutagen not installed")
+    def test_reads_tags_from_mutagen_tag_object(self, mock_mp3_file: Path) -> None:
+        """Test that real mutagen tag objects are read without conversion."""
+        from mutagen.easyid3 import EasyID3
+
+        tags = EasyID3()
+        tags["artist"] = ["Pink Floyd"]
+        tags["date"] = ["1979"]
+        mock_audio = MagicMock()
+        mock_audio.info.bitrate = 0
+        mock_audio.tags = tags
+
+        with patch("mediacopier.core.metadata_audio.MP3", return_value=mock_audio):
+            meta = extract_audio_metadata(mock_mp3_file)
+
+        assert meta is not None
+        assert meta.artist == "Pink Floyd"
+        assert meta.year == "1979"
+        assert meta.bitrate_kbps is None
+
 
 class TestMutagenAvailabilityFlag:
     """Tests for MUTAGEN_AVAILABLE flag."""
@@ -285,3 +357,48 @@ class TestMutagenAvailabilityFlag:
     def test_flag_is_boolean(self) -> None:
         """Test that MUTAGEN_AVAILABLE flag is a boolean."""
         assert isinstance(MUTAGEN_AVAILABLE, bool)
+
+    @pytest.mark.skipif(not MUTAGEN_AVAILABLE, reason="mutagen not installed")
+    def test_import_does_not_load_mutagen(self) -> None:
+        """Test that importing the module defers the mutagen import."""
+        src_dir = Path(__file__).resolve().parents[1] / "src"
+        code = (
+            "import sys, mediacopier.core.metadata_audio as m; "
+            "m.parse_artist_title_from_filename('A - B'); "
+            "print('mutagen' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": str(src_dir)},
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+    @pytest.mark.skipif(not MUTAGEN_AVAILABLE, reason="mutagen not installed")
+    def test_mutagen_classes_resolve_on_access(self) -> None:
+        """Test that mutagen classes are available as module attributes."""
+        from mutagen.mp3 import MP3
+
+        assert metadata_audio.MP3 is MP3
+
+    def test_failed_mutagen_import_not_retried(self) -> None:
+        """Test that a broken mutagen install is only imported once."""
+        with patch.dict(metadata_audio.__dict__):
+            for name in metadata_audio._MUTAGEN_ATTRS:
+                metadata_audio.__dict__.pop(name, None)
+            metadata_audio._mutagen_loaded = None
+            with patch(
+                "mediacopier.core.metadata_audio.importlib.import_module",
+                side_effect=ImportError("broken"),
+            ) as import_module:
+                assert metadata_audio._load_mutagen() is False
+                assert metadata_audio._load_mutagen() is False
+
+        assert import_module.call_count == 1
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unrelated attribute lookups still fail normally."""
+        with pytest.raises(AttributeError):
+            metadata_audio.not_a_real_attribute
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import json
+import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
 from mediacopier.core.metadata_video import (
     FFPROBE_AVAILABLE,
     VideoMeta,
+    _run_ffprobe,
     extract_video_metadata,
+    extract_video_metadata_batch,
+    filter_min_duration,
     meets_minimum_duration,
     parse_ffprobe_json,
 )
@@ -241,6 +246,21 @@ class TestParseFfprobeJson:
         assert meta.video_streams == 1
         assert meta.audio_streams == 0
 
+    def test_not_available_values(self) -> None:
+        """Test that ffprobe "N/A" values fall back to later streams."""
+        meta = parse_ffprobe_json({
+            "format": {"duration": "N/A"},
+            "streams": [
+                {"codec_type": "video", "width": "N/A", "height": "N/A", "duration": "N/A"},
+                {"codec_type": "video", "width": 640, "height": "480", "duration": "12.5"},
+            ],
+        })
+
+        assert meta.duration_sec == 12.5
+        assert meta.width == 640
+        assert meta.height == 480
+        assert meta.video_streams == 2
+
     def test_empty_dict(self) -> None:
         """Test parsing an empty dictionary."""
         meta = parse_ffprobe_json({})
@@ -332,6 +352,48 @@ class TestExtractVideoMetadata:
                 assert meta.height == 1080
                 assert meta.codec == "h264"
 
+    def test_batch_preserves_order(self, tmp_path: Path) -> None:
+        """Test that batch extraction returns results in input order."""
+        outputs = {
+            "a.mp4": FFPROBE_FIXTURE_STANDARD,
+            "b.mp4": None,
+            "c.mp4": {"format": {"duration": "42.0"}},
+        }
+
+        def fake_run(path: Path) -> dict | None:
+            return outputs[path.name]
+
+        paths = [tmp_path / name for name in outputs]
+        with patch("mediacopier.core.metadata_video.FFPROBE_AVAILABLE", True):
+            with patch("mediacopier.core.metadata_video._run_ffprobe", side_effect=fake_run):
+                metas = extract_video_metadata_batch(paths, max_workers=3)
+
+        assert [m.duration_sec for m in metas] == [120.5, None, 42.0]
+
+    def test_batch_fallback_when_no_ffprobe(self) -> None:
+        """Test that batch extraction returns empty metadata without ffprobe."""
+        with patch("mediacopier.core.metadata_video.FFPROBE_AVAILABLE", False):
+            metas = extract_video_metadata_batch(["/fake/a.mp4", "/fake/b.mp4"])
+        assert metas == [VideoMeta(), VideoMeta()]
+
+
+class TestRunFfprobe:
+    """Tests for _run_ffprobe output decoding."""
+
+    def test_decodes_bytes_output(self, tmp_path: Path) -> None:
+        """Test that ffprobe stdout bytes are decoded to a dict."""
+        completed = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=json.dumps(FFPROBE_FIXTURE_STANDARD).encode()
+        )
+        with patch("mediacopier.core.metadata_video.subprocess.run", return_value=completed):
+            assert _run_ffprobe(tmp_path / "a.mp4") == FFPROBE_FIXTURE_STANDARD
+
+    def test_invalid_json_returns_none(self, tmp_path: Path) -> None:
+        """Test that malformed ffprobe output is treated as a failure."""
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"{not json")
+        with patch("mediacopier.core.metadata_video.subprocess.run", return_value=completed):
+            assert _run_ffprobe(tmp_path / "a.mp4") is None
+
 
 class TestFfprobeAvailabilityFlag:
     """Tests for FFPROBE_AVAILABLE flag."""
@@ -362,3 +424,18 @@ class TestFilterByMinimumDuration:
         assert filtered[0].duration_sec == 180.0
         assert filtered[1].duration_sec == 300.0
         assert filtered[2].duration_sec is None
+
+    def test_filter_min_duration_matches_per_item_check(self) -> None:
+        """Test that the batch filter agrees with meets_minimum_duration."""
+        videos = [
+            VideoMeta(duration_sec=60.0),
+            None,
+            VideoMeta(duration_sec=180.0),
+            VideoMeta(duration_sec=float("nan")),
+            VideoMeta(),
+            VideoMeta(duration_sec=300.0),
+        ]
+
+        for min_duration in (0.0, -1.0, 180.0, 1000.0):
+            expected = [v for v in videos if meets_minimum_duration(v, min_duration)]
+            assert filter_min_duration(videos, min_duration) == expected
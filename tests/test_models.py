@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+from unittest.mock import patch
+
 import pytest
 
 from mediacopier.core.models import (
@@ -49,9 +52,7 @@ class TestRequestedItem:
         data = original.to_dict()
         restored = RequestedItem.from_dict(data)
 
-        assert restored.tipo == original.tipo
-        assert restored.texto_original == original.texto_original
-        assert restored.texto_normalizado == original.texto_normalizado
+        assert restored == original
 
 
 class TestCopyRules:
@@ -67,16 +68,23 @@ class TestCopyRules:
         assert rules.excluir_palabras == []
         assert rules.organizar_por_genero is False
 
-    def test_validate_negative_size(self) -> None:
-        """Test validation fails for negative size."""
-        rules = CopyRules(tamano_min_mb=-1.0)
-        with pytest.raises(ValidationError, match="tamano_min_mb no puede ser negativo"):
-            rules.validate()
-
-    def test_validate_negative_duration(self) -> None:
-        """Test validation fails for negative duration."""
-        rules = CopyRules(duracion_min_seg=-5.0)
-        with pytest.raises(ValidationError, match="duracion_min_seg no puede ser negativa"):
+    @pytest.mark.parametrize(
+        ("field_name", "value", "message"),
+        [
+            ("tamano_min_mb", -1.0, "tamano_min_mb no puede ser negativo"),
+            ("tamano_max_mb", -10.0, "tamano_max_mb no puede ser negativo"),
+            ("duracion_min_seg", -5.0, "duracion_min_seg no puede ser negativa"),
+            ("duracion_max_seg", -100.0, "duracion_max_seg no puede ser negativa"),
+            ("umbral_fuzzy", -10.0, "umbral_fuzzy debe estar entre 0 y 100"),
+            ("umbral_fuzzy", 150.0, "umbral_fuzzy debe estar entre 0 y 100"),
+        ],
+    )
+    def test_validate_rejects_out_of_range(
+        self, field_name: str, value: float, message: str
+    ) -> None:
+        """Test validation fails for negative limits and out-of-range thresholds."""
+        rules = CopyRules(**{field_name: value})
+        with pytest.raises(ValidationError, match=message):
             rules.validate()
 
     def test_valid_rules(self) -> None:
@@ -102,11 +110,7 @@ class TestCopyRules:
         data = original.to_dict()
         restored = CopyRules.from_dict(data)
 
-        assert restored.extensiones_permitidas == original.extensiones_permitidas
-        assert restored.tamano_min_mb == original.tamano_min_mb
-        assert restored.duracion_min_seg == original.duracion_min_seg
-        assert restored.incluir_subcarpetas == original.incluir_subcarpetas
-        assert restored.excluir_palabras == original.excluir_palabras
+        assert restored == original
 
 
 class TestCopyStats:
@@ -133,11 +137,7 @@ class TestCopyStats:
         data = original.to_dict()
         restored = CopyStats.from_dict(data)
 
-        assert restored.archivos_encontrados == original.archivos_encontrados
-        assert restored.archivos_copiados == original.archivos_copiados
-        assert restored.archivos_omitidos == original.archivos_omitidos
-        assert restored.archivos_error == original.archivos_error
-        assert restored.bytes_copiados == original.bytes_copiados
+        assert restored == original
 
 
 class TestCopyJob:
@@ -226,16 +226,7 @@ class TestCopyJob:
         data = original.to_dict()
         restored = CopyJob.from_dict(data)
 
-        assert restored.id == original.id
-        assert restored.nombre == original.nombre
-        assert restored.origenes == original.origenes
-        assert restored.destino == original.destino
-        assert restored.modo_organizacion == original.modo_organizacion
-        assert len(restored.lista_items) == len(original.lista_items)
-        assert restored.lista_items[0].texto_original == original.lista_items[0].texto_original
-        assert restored.reglas.extensiones_permitidas == original.reglas.extensiones_permitidas
-        assert restored.estado == original.estado
-        assert restored.stats.archivos_encontrados == original.stats.archivos_encontrados
+        assert restored == original
 
     def test_to_json_from_json_roundtrip(self) -> None:
         """Test full JSON string roundtrip for CopyJob."""
@@ -253,10 +244,7 @@ class TestCopyJob:
         json_str = original.to_json()
         restored = CopyJob.from_json(json_str)
 
-        assert restored.id == original.id
-        assert restored.nombre == original.nombre
-        assert restored.destino == original.destino
-        assert restored.modo_organizacion == original.modo_organizacion
+        assert restored == original
         assert restored.lista_items[0].texto_original == "Inception"
         assert restored.reglas.duracion_min_seg == 300.0
         assert restored.estado == CopyJobStatus.COMPLETED
@@ -336,29 +324,92 @@ class TestQueueExportImport:
         restored = import_queue_from_json(json_str)
         assert restored == []
 
+    def test_export_matches_stdlib_layout(self) -> None:
+        """Test that the export is indented JSON with non-ASCII text kept as-is."""
+        jobs = [CopyJob(nombre="Canción ñandú", origenes=["/música"], destino="/dst")]
+
+        json_str = export_queue_to_json(jobs)
+
+        expected = json.dumps([job.to_dict() for job in jobs], ensure_ascii=False, indent=2)
+        assert json_str == expected
+
+    def test_roundtrip_without_orjson(self) -> None:
+        """Test that the stdlib json fallback produces the same output."""
+        jobs = [CopyJob(nombre="Job", origenes=["/src"], destino="/dst")]
+        fast = export_queue_to_json(jobs)
+
+        with patch("mediacopier.core.models.ORJSON_AVAILABLE", False):
+            with patch("mediacopier.core.models._loads", json.loads):
+                slow = export_queue_to_json(jobs)
+                restored = import_queue_from_json(slow)
+
+        assert slow == fast
+        assert restored == jobs
+
+
+class TestSlottedModels:
+    """Tests that the model dataclasses use __slots__."""
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            RequestedItem(tipo=RequestedItemType.SONG, texto_original="Song"),
+            CopyRules(),
+            CopyStats(),
+            CopyJob(nombre="Job", origenes=["/src"], destino="/dst"),
+            Profile(nombre="Profile"),
+        ],
+    )
+    def test_no_instance_dict(self, instance: object) -> None:
+        """Test that instances have no __dict__ and reject unknown attributes."""
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.not_a_field = True  # type: ignore[attr-defined]
+
 
 class TestOrganizationModeEnum:
     """Tests for OrganizationMode enum."""
 
-    def test_all_modes_exist(self) -> None:
-        """Test that all required modes exist."""
-        assert OrganizationMode.SINGLE_FOLDER.value == "single_folder"
-        assert OrganizationMode.SCATTER_BY_ARTIST.value == "scatter_by_artist"
-        assert OrganizationMode.SCATTER_BY_GENRE.value == "scatter_by_genre"
-        assert OrganizationMode.FOLDER_PER_REQUEST.value == "folder_per_request"
-        assert OrganizationMode.KEEP_RELATIVE.value == "keep_relative"
+    @pytest.mark.parametrize(
+        ("mode", "value"),
+        [
+            (OrganizationMode.SINGLE_FOLDER, "single_folder"),
+            (OrganizationMode.SCATTER_BY_ARTIST, "scatter_by_artist"),
+            (OrganizationMode.SCATTER_BY_GENRE, "scatter_by_genre"),
+            (OrganizationMode.FOLDER_PER_REQUEST, "folder_per_request"),
+            (OrganizationMode.KEEP_RELATIVE, "keep_relative"),
+        ],
+    )
+    def test_all_modes_exist(self, mode: OrganizationMode, value: str) -> None:
+        """Test that all required modes exist with their serialized values."""
+        assert mode.value == value
+        assert OrganizationMode(value) is mode
+
+    def test_from_dict_rejects_unknown_mode(self) -> None:
+        """Test that an unknown serialized mode raises ValueError."""
+        with pytest.raises(ValueError):
+            Profile.from_dict({"nombre": "P", "modo_organizacion": "nope"})
+        with pytest.raises(ValueError):
+            Profile.from_dict({"nombre": "P", "modo_organizacion": ["unhashable"]})
 
 
 class TestRequestedItemTypeEnum:
     """Tests for RequestedItemType enum."""
 
-    def test_all_types_exist(self) -> None:
-        """Test that all required types exist."""
-        assert RequestedItemType.SONG.value == "song"
-        assert RequestedItemType.MOVIE.value == "movie"
-        assert RequestedItemType.GENRE.value == "genre"
-        assert RequestedItemType.ARTIST.value == "artist"
-        assert RequestedItemType.FOLDER.value == "folder"
+    @pytest.mark.parametrize(
+        ("item_type", "value"),
+        [
+            (RequestedItemType.SONG, "song"),
+            (RequestedItemType.MOVIE, "movie"),
+            (RequestedItemType.GENRE, "genre"),
+            (RequestedItemType.ARTIST, "artist"),
+            (RequestedItemType.FOLDER, "folder"),
+        ],
+    )
+    def test_all_types_exist(self, item_type: RequestedItemType, value: str) -> None:
+        """Test that all required types exist with their serialized values."""
+        assert item_type.value == value
+        assert RequestedItemType(value) is item_type
 
 
 class TestCopyRulesNewFields:
@@ -375,18 +426,6 @@ class TestCopyRulesNewFields:
         assert rules.usar_fuzzy is True
         assert rules.umbral_fuzzy == 60.0
 
-    def test_validate_invalid_fuzzy_threshold_negative(self) -> None:
-        """Test validation fails for negative fuzzy threshold."""
-        rules = CopyRules(umbral_fuzzy=-10.0)
-        with pytest.raises(ValidationError, match="umbral_fuzzy debe estar entre 0 y 100"):
-            rules.validate()
-
-    def test_validate_invalid_fuzzy_threshold_over_100(self) -> None:
-        """Test validation fails for fuzzy threshold over 100."""
-        rules = CopyRules(umbral_fuzzy=150.0)
-        with pytest.raises(ValidationError, match="umbral_fuzzy debe estar entre 0 y 100"):
-            rules.validate()
-
     def test_validate_valid_fuzzy_threshold(self) -> None:
         """Test validation passes for valid fuzzy threshold."""
         rules = CopyRules(umbral_fuzzy=85.0)
@@ -406,13 +445,7 @@ class TestCopyRulesNewFields:
         data = original.to_dict()
         restored = CopyRules.from_dict(data)
 
-        assert restored.filtrar_por_tamano == original.filtrar_por_tamano
-        assert restored.filtrar_por_duracion == original.filtrar_por_duracion
-        assert restored.solo_extensiones_seleccionadas == original.solo_extensiones_seleccionadas
-        assert restored.dry_run == original.dry_run
-        assert restored.evitar_duplicados == original.evitar_duplicados
-        assert restored.usar_fuzzy == original.usar_fuzzy
-        assert restored.umbral_fuzzy == original.umbral_fuzzy
+        assert restored == original
 
 
 class TestAdvancedRulesFields:
@@ -431,18 +464,6 @@ class TestAdvancedRulesFields:
         assert rules.tamano_max_mb == 0.0
         assert rules.duracion_max_seg == 0.0
 
-    def test_validate_negative_max_size(self) -> None:
-        """Test validation fails for negative max size."""
-        rules = CopyRules(tamano_max_mb=-10.0)
-        with pytest.raises(ValidationError, match="tamano_max_mb no puede ser negativo"):
-            rules.validate()
-
-    def test_validate_negative_max_duration(self) -> None:
-        """Test validation fails for negative max duration."""
-        rules = CopyRules(duracion_max_seg=-100.0)
-        with pytest.raises(ValidationError, match="duracion_max_seg no puede ser negativa"):
-            rules.validate()
-
     def test_advanced_fields_to_dict_from_dict_roundtrip(self) -> None:
         """Test JSON roundtrip for advanced CopyRules fields."""
         original = CopyRules(
@@ -459,15 +480,7 @@ class TestAdvancedRulesFields:
         data = original.to_dict()
         restored = CopyRules.from_dict(data)
 
-        assert restored.extensiones_audio_permitidas == original.extensiones_audio_permitidas
-        assert restored.extensiones_audio_bloqueadas == original.extensiones_audio_bloqueadas
-        assert restored.extensiones_video_permitidas == original.extensiones_video_permitidas
-        assert restored.extensiones_video_bloqueadas == original.extensiones_video_bloqueadas
-        assert restored.solo_mejor_match == original.solo_mejor_match
-        assert restored.preferir_resolucion_alta == original.preferir_resolucion_alta
-        assert restored.codecs_preferidos == original.codecs_preferidos
-        assert restored.tamano_max_mb == original.tamano_max_mb
-        assert restored.duracion_max_seg == original.duracion_max_seg
+        assert restored == original
 
     def test_exclusion_words_list(self) -> None:
         """Test exclusion words list in rules."""
@@ -503,17 +516,7 @@ class TestAdvancedRulesFields:
         restored.validate()  # Should not raise
 
         # Verify all fields match
-        assert restored.excluir_palabras == original.excluir_palabras
-        assert restored.extensiones_audio_permitidas == original.extensiones_audio_permitidas
-        assert restored.extensiones_video_permitidas == original.extensiones_video_permitidas
-        assert restored.extensiones_video_bloqueadas == original.extensiones_video_bloqueadas
-        assert restored.solo_mejor_match == original.solo_mejor_match
-        assert restored.preferir_resolucion_alta == original.preferir_resolucion_alta
-        assert restored.codecs_preferidos == original.codecs_preferidos
-        assert restored.tamano_min_mb == original.tamano_min_mb
-        assert restored.tamano_max_mb == original.tamano_max_mb
-        assert restored.duracion_min_seg == original.duracion_min_seg
-        assert restored.duracion_max_seg == original.duracion_max_seg
+        assert restored == original
 
 
 class TestProfile:
@@ -577,13 +580,7 @@ class TestProfile:
         data = original.to_dict()
         restored = Profile.from_dict(data)
 
-        assert restored.nombre == original.nombre
-        assert restored.modo_organizacion == original.modo_organizacion
-        assert restored.reglas.extensiones_permitidas == original.reglas.extensiones_permitidas
-        assert restored.reglas.tamano_min_mb == original.reglas.tamano_min_mb
-        assert restored.reglas.filtrar_por_tamano == original.reglas.filtrar_por_tamano
-        assert restored.reglas.usar_fuzzy == original.reglas.usar_fuzzy
-        assert restored.reglas.umbral_fuzzy == original.reglas.umbral_fuzzy
+        assert restored == original
 
     def test_to_json_from_json_roundtrip(self) -> None:
         """Test full JSON string roundtrip for Profile."""
@@ -600,12 +597,7 @@ class TestProfile:
         json_str = original.to_json()
         restored = Profile.from_json(json_str)
 
-        assert restored.nombre == original.nombre
-        assert restored.modo_organizacion == original.modo_organizacion
-        assert restored.reglas.extensiones_permitidas == original.reglas.extensiones_permitidas
-        assert restored.reglas.duracion_min_seg == original.reglas.duracion_min_seg
-        assert restored.reglas.filtrar_por_duracion == original.reglas.filtrar_por_duracion
-        assert restored.reglas.dry_run == original.reglas.dry_run
+        assert restored == original
 
 
 class TestProfileManager:
@@ -644,9 +636,9 @@ class TestProfileManager:
         manager = ProfileManager(profiles_dir=str(tmp_path))
 
         # Save multiple profiles
-        manager.save_profile(Profile(nombre="Profile A"))
-        manager.save_profile(Profile(nombre="Profile B"))
-        manager.save_profile(Profile(nombre="Profile C"))
+        manager.save_profiles(
+            [Profile(nombre="Profile A"), Profile(nombre="Profile B"), Profile(nombre="Profile C")]
+        )
 
         profiles = manager.list_profiles()
         assert len(profiles) == 3
@@ -654,6 +646,33 @@ class TestProfileManager:
         assert "Profile B" in profiles
         assert "Profile C" in profiles
 
+    def test_list_profiles_reparses_only_changed_files(self, tmp_path) -> None:
+        """Test that unchanged profile files are not parsed again."""
+        manager = ProfileManager(profiles_dir=str(tmp_path))
+        manager.save_profile(Profile(nombre="Profile A"))
+        manager.save_profile(Profile(nombre="Profile B"))
+        (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+        with patch.object(
+            ProfileManager, "_read_profile_name", wraps=ProfileManager._read_profile_name
+        ) as read_name:
+            assert manager.list_profiles() == ["Profile A", "Profile B"]
+            assert read_name.call_count == 1  # only the file not saved by this manager
+            assert manager.list_profiles() == ["Profile A", "Profile B"]
+            assert read_name.call_count == 1
+
+    def test_list_profiles_sees_external_changes(self, tmp_path) -> None:
+        """Test that files added or removed outside the manager are picked up."""
+        manager = ProfileManager(profiles_dir=str(tmp_path))
+        path_a = manager.save_profile(Profile(nombre="Profile A"))
+        assert manager.list_profiles() == ["Profile A"]
+
+        other = ProfileManager(profiles_dir=str(tmp_path))
+        other.save_profile(Profile(nombre="Profile B"))
+        path_a.unlink()
+
+        assert manager.list_profiles() == ["Profile B"]
+
     def test_delete_profile(self, tmp_path) -> None:
         """Test deleting a profile."""
         manager = ProfileManager(profiles_dir=str(tmp_path))
@@ -676,6 +695,15 @@ class TestProfileManager:
         with pytest.raises(ValidationError):
             manager.save_profile(profile)
 
+    def test_save_profiles_validates_all_before_writing(self, tmp_path) -> None:
+        """Test that one invalid profile prevents the whole batch from being written."""
+        manager = ProfileManager(profiles_dir=str(tmp_path))
+
+        with pytest.raises(ValidationError):
+            manager.save_profiles([Profile(nombre="Valid"), Profile(nombre="")])
+
+        assert manager.list_profiles() == []
+
     def test_acceptance_criteria_usb_musica_profile(self, tmp_path) -> None:
         """Test acceptance criteria: save and load 'USB Música' profile for a new job."""
         manager = ProfileManager(profiles_dir=str(tmp_path))